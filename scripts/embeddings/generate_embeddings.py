@@ -129,7 +129,7 @@ async def generate_embeddings(
                 from beanie import PydanticObjectId
                 opp_id = PydanticObjectId(result.id)
                 await Opportunity.find_one({"_id": opp_id}).update(
-                    {"$set": {"embedding": result.embedding, "updated_at": datetime.utcnow()}}
+                    {"$set": {"embedding": result.to_list(), "updated_at": datetime.utcnow()}}
                 )
                 success += 1
             except Exception as e:
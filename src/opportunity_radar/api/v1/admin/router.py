@@ -918,7 +918,7 @@ async def generate_embeddings(
             try:
                 opp_id = PydanticObjectId(result.id)
                 await Opportunity.find_one({"_id": opp_id}).update(
-                    {"$set": {"embedding": result.embedding, "updated_at": utc_now()}}
+                    {"$set": {"embedding": result.to_list(), "updated_at": utc_now()}}
                 )
                 success += 1
             except Exception as e:
@@ -974,7 +974,7 @@ async def generate_single_embedding(
         )
 
     # Save embedding
-    opportunity.embedding = result.embedding
+    opportunity.embedding = result.to_list()
     opportunity.updated_at = utc_now()
     await opportunity.save()
 
@@ -70,7 +70,7 @@ def enrich_match_with_opportunity(
         include_prize_pool: Whether to include prize pool
 
     Returns:
-        Enriched match data as dictionary
+        Enriched match data as a JSON-safe dictionary
     """
     match_data = match.model_dump(mode="json")
 
@@ -138,8 +138,8 @@ async def enrich_matches_with_opportunities(
     if not matches:
         return []
 
-    # Fetch all opportunities in one query
-    opp_ids = [m.opportunity_id for m in matches]
+    # Fetch all opportunities in one query (distinct, non-null IDs only)
+    opp_ids = list(dict.fromkeys(m.opportunity_id for m in matches if m.opportunity_id))
     opp_by_id = await fetch_opportunities_by_ids(opp_ids)
 
     # Enrich each match
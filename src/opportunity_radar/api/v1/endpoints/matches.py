@@ -3,6 +3,7 @@
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from beanie import PydanticObjectId
 
 from ....core.security import get_current_user
@@ -57,12 +58,15 @@ async def list_matches(
         include_prize_pool=True,
     )
 
-    return {
-        "items": items,
-        "total": total,
-        "limit": limit,
-        "offset": actual_offset,
-    }
+    # Items are already JSON-safe; skip FastAPI's jsonable_encoder walk over them
+    return JSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "limit": limit,
+            "offset": actual_offset,
+        }
+    )
 
 
 @router.get("/top")
@@ -87,7 +91,8 @@ async def get_top_matches(
     # Enrich matches with opportunity data using helper
     items = await enrich_matches_with_opportunities(matches)
 
-    return {"items": items, "count": len(items)}
+    # Items are already JSON-safe; skip FastAPI's jsonable_encoder walk over them
+    return JSONResponse({"items": items, "count": len(items)})
 
 
 @router.get("/by-batch/{batch_id}")
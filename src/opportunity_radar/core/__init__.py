@@ -2,6 +2,7 @@
 
 from .security import (
     verify_password,
+    verify_and_update_password,
     get_password_hash,
     create_access_token,
     create_refresh_token,
@@ -18,6 +19,7 @@ from .exceptions import (
 
 __all__ = [
     "verify_password",
+    "verify_and_update_password",
     "get_password_hash",
     "create_access_token",
     "create_refresh_token",
@@ -14,8 +14,16 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: new hashes use Argon2id (t=3, m=46 MiB, p=1; above
+# OWASP's m=46 MiB, t=1, p=1 minimum). bcrypt stays listed so existing hashes
+# keep verifying; verify_and_update_password upgrades them on login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=3,
+    argon2__memory_cost=46 * 1024,
+    argon2__parallelism=1,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -23,6 +31,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify a password; also return a new hash if the stored one is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
@@ -79,7 +79,7 @@ class EvaluationResult:
         return [r.reason for r in self.failed_rules]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileContext:
     """Profile data for rule evaluation."""
 
@@ -93,7 +93,7 @@ class ProfileContext:
     is_remote_ok: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class OpportunityContext:
     """Opportunity/Batch data for rule evaluation."""
 
@@ -8,7 +8,7 @@ from ..core.security import (
     create_refresh_token,
     decode_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
 from ..models.user import User
 from ..models.profile import Profile
@@ -49,12 +49,18 @@ class AuthService:
         if not user:
             raise UnauthorizedException(message="Invalid email or password")
 
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             raise UnauthorizedException(message="Invalid email or password")
 
         if not user.is_active:
             raise UnauthorizedException(message="User account is disabled")
 
+        # Upgrade legacy bcrypt (or outdated Argon2) hashes while we have the password
+        if new_hash:
+            user.hashed_password = new_hash
+            await user.save()
+
         # Create tokens
         access_token = create_access_token(data={"sub": str(user.id)})
         refresh_token = create_refresh_token(data={"sub": str(user.id)})
@@ -1,13 +1,23 @@
 """Embedding service for semantic search and matching."""
 
+import base64
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
-from openai import OpenAI
+import numpy as np
 
 from ..config import get_settings
 
+# openai and tiktoken are imported where first used, so importing this module
+# (for constants, text builders or EmbeddingResult) stays cheap
+if TYPE_CHECKING:
+    import tiktoken
+
 logger = logging.getLogger(__name__)
 
 # text-embedding-3-small outputs 1536 dimensions by default
@@ -17,26 +27,211 @@ EMBEDDING_DIMENSION = 1536
 # OpenAI API limits
 MAX_BATCH_SIZE = 2048  # Maximum texts per batch request
 MAX_TOKENS_PER_REQUEST = 8191  # Maximum tokens per text
-
-
-@dataclass
+MAX_TOKENS_PER_BATCH = 300_000  # Maximum total tokens across one batch request
+MAX_CONCURRENT_REQUESTS = 8  # Sub-batch requests kept in flight at once
+
+# Opportunity description budget, leaving room for title/tags/tech in the same text
+DESCRIPTION_MAX_TOKENS = 500
+DESCRIPTION_MAX_CHARS = 2000  # Fallback when no tokenizer is available
+
+# Number of embeddings kept in the in-process cache
+EMBEDDING_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional["tiktoken.Encoding"]:
+    """Tokenizer for EMBEDDING_MODEL, or None if it can't be loaded (e.g. offline)."""
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+        return None
+
+
+def _token_counts(texts: List[str]) -> List[int]:
+    """Token count per text; falls back to the UTF-8 byte length as an upper bound."""
+    encoding = _get_encoding()
+    if encoding is None:
+        # Every token covers at least one byte, so this never undercounts CJK or emoji
+        return [len(text.encode("utf-8")) for text in texts]
+    return [len(tokens) for tokens in encoding.encode_batch(texts)]
+
+
+def _truncate_to_tokens(
+    text: str, max_tokens: int = MAX_TOKENS_PER_REQUEST, max_chars: int = 8000
+) -> str:
+    """Cut text to at most max_tokens tokens (max_chars characters if no tokenizer)."""
+    # Every token covers at least one UTF-8 byte, so short texts can't be over
+    if len(text) * 4 <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_chars]
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _pack_chunks(texts: List[str]) -> Iterator[List[str]]:
+    """Greedily group texts into chunks within the per-request item and token limits."""
+    chunk: List[str] = []
+    chunk_tokens = 0
+    for text, tokens in zip(texts, _token_counts(texts)):
+        if chunk and (
+            len(chunk) >= MAX_BATCH_SIZE or chunk_tokens + tokens > MAX_TOKENS_PER_BATCH
+        ):
+            yield chunk
+            chunk, chunk_tokens = [], 0
+        chunk.append(text)
+        chunk_tokens += tokens
+    if chunk:
+        yield chunk
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row as float32; all-zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+# Abbreviation -> full term, keyed by lowercase abbreviation
+TECH_EXPANSIONS: Dict[str, str] = {
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "py": "Python",
+    "ml": "Machine Learning",
+    "ai": "Artificial Intelligence",
+    "llm": "Large Language Model",
+    "db": "Database",
+    "api": "API backend",
+    "ui": "User Interface",
+    "ux": "User Experience",
+}
+
+# Goal -> descriptive phrase, keyed by lowercase goal
+GOAL_EXPANSIONS: Dict[str, str] = {
+    "funding": "funding and investment opportunities",
+    "prizes": "competitions with cash prizes",
+    "learning": "learning new skills and technologies",
+    "networking": "networking and meeting collaborators",
+    "exposure": "visibility and user acquisition",
+    "mentorship": "mentorship and guidance from experts",
+    "building": "building and shipping products at hackathons",
+    "equity": "equity-based accelerator programs",
+}
+
+
+def _normalize_term(term: str) -> str:
+    """Lookup key for the expansion maps: trimmed and case-folded."""
+    return term.strip().lower()
+
+
+# Max SimHash bit distance at which two texts count as the same for embedding reuse
+SIMHASH_MAX_DISTANCE = 3
+
+
+def _simhash(text: str) -> int:
+    """64-bit SimHash over character 3-gram shingles of whitespace-normalized text."""
+    normalized = " ".join(text.lower().split())
+    shingles = {normalized[i : i + 3] for i in range(max(len(normalized) - 2, 1))}
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+# eq=False: comparing ndarray fields with == is ambiguous, so results
+# compare and hash by identity
+@dataclass(slots=True, frozen=True, eq=False)
 class EmbeddingResult:
     """Result of embedding generation."""
 
     id: str
-    embedding: List[float]
+    embedding: np.ndarray  # float32, 1-D; empty on failure
     text_length: int
     success: bool = True
     error: Optional[str] = None
 
+    def to_list(self) -> List[float]:
+        """Embedding as plain floats, for BSON/JSON serialization."""
+        return self.embedding.tolist()
+
+
+def _decode_embedding(data: str) -> np.ndarray:
+    """Decode a base64 embedding from the API into a float32 vector."""
+    return np.frombuffer(base64.b64decode(data), dtype="<f4")
+
+
+def _empty_embedding() -> np.ndarray:
+    """Zero-length float32 vector used for failed results."""
+    return np.empty(0, dtype=np.float32)
+
+
+class EmbeddingCache:
+    """LRU cache of embedding vectors, keyed by a text digest or an opportunity ID."""
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._simhashes: Dict[str, int] = {}
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Stable cache key for a text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[float, ...]]:
+        """Return the cached embedding for a key, or None."""
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+        return embedding
+
+    def get_similar(
+        self, key: str, simhash: int, max_distance: int = SIMHASH_MAX_DISTANCE
+    ) -> Optional[Tuple[float, ...]]:
+        """Return the embedding stored under key if its SimHash is within max_distance bits."""
+        other = self._simhashes.get(key)
+        if other is None or (simhash ^ other).bit_count() > max_distance:
+            return None
+        return self.get(key)
+
+    def put(
+        self, key: str, embedding: Tuple[float, ...], simhash: Optional[int] = None
+    ) -> None:
+        """Store an embedding, evicting the least recently used entry when full."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        if simhash is not None:
+            self._simhashes[key] = simhash
+        if len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._simhashes.pop(evicted, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class EmbeddingService:
     """Service for generating and managing text embeddings."""
 
     def __init__(self):
+        from openai import OpenAI
+
         settings = get_settings()
         self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = EMBEDDING_MODEL
+        self.cache = EmbeddingCache()
+        # Last embedding per opportunity ID, with the SimHash of the text it came from
+        self.opportunity_cache = EmbeddingCache()
+        # Load the BPE tables now rather than on the first user request
+        _get_encoding()
 
     def get_embedding(self, text: str) -> List[float]:
         """
@@ -51,20 +246,30 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        # Truncate if too long (model limit is ~8191 tokens)
-        text = text[:8000]
+        # Truncate if too long (model limit is 8191 tokens)
+        text = _truncate_to_tokens(text)
+
+        # Identical text (e.g. an unchanged profile or opportunity) needs no API call
+        key = self.cache.key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            # Entries are tuples, so a caller editing its list can't change the cache
+            return list(cached)
 
         try:
             response = self.client.embeddings.create(
                 input=text,
                 model=self.model,
+                encoding_format="base64",
             )
-            return response.data[0].embedding
+            embedding = _decode_embedding(response.data[0].embedding).tolist()
+            self.cache.put(key, tuple(embedding))
+            return embedding
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
 
-    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    def get_embeddings_batch(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for multiple texts in a batch.
 
@@ -72,32 +277,100 @@ class EmbeddingService:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            float32 matrix with one embedding row per non-empty text
         """
         if not texts:
-            return []
+            return np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
 
         # Filter and truncate texts
         processed_texts = []
         for text in texts:
             if text and text.strip():
-                processed_texts.append(text[:8000])
+                processed_texts.append(_truncate_to_tokens(text))
 
         if not processed_texts:
-            return []
+            return np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+
+        # Embed each distinct text once, then map rows back to input positions
+        first_seen: Dict[str, int] = {}
+        positions = [first_seen.setdefault(text, len(first_seen)) for text in processed_texts]
+        chunks = list(_pack_chunks(list(first_seen)))
 
         try:
-            response = self.client.embeddings.create(
-                input=processed_texts,
-                model=self.model,
-            )
-            # Sort by index to maintain order
-            sorted_data = sorted(response.data, key=lambda x: x.index)
-            return [item.embedding for item in sorted_data]
+            if len(chunks) == 1:
+                unique_embeddings = self._embed_chunk(chunks[0])
+            else:
+                # Overlap the network round-trips of independent sub-batches;
+                # map() yields in submission order so rows stay aligned with texts
+                workers = min(MAX_CONCURRENT_REQUESTS, len(chunks))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    unique_embeddings = np.concatenate(list(pool.map(self._embed_chunk, chunks)))
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
 
+        if len(first_seen) == len(positions):
+            return unique_embeddings
+        return unique_embeddings[positions]
+
+    def _embed_chunk(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one packed chunk of texts.
+
+        If the API rejects the request as too large, the chunk is halved and
+        each half retried, down to the single text that is actually rejected.
+        """
+        from openai import BadRequestError
+
+        try:
+            return self._request_embeddings(texts)
+        except BadRequestError:
+            if len(texts) == 1:
+                raise
+            mid = len(texts) // 2
+            logger.warning(f"Embedding request of {len(texts)} texts rejected, splitting")
+            return np.concatenate(
+                [self._embed_chunk(texts[:mid]), self._embed_chunk(texts[mid:])]
+            )
+
+    def _embed_chunk_isolated(self, texts: List[str]) -> List[Union[np.ndarray, Exception]]:
+        """
+        Embed one packed chunk of texts, isolating the texts the API rejects.
+
+        Like _embed_chunk, a rejected request is halved and each half retried,
+        but a text rejected on its own is returned as its error instead of
+        failing the chunk, and halves that succeed are kept. Any other error
+        (rate limit, authentication, connection) is raised without retrying.
+        """
+        from openai import BadRequestError
+
+        try:
+            return list(self._request_embeddings(texts))
+        except BadRequestError as e:
+            if len(texts) == 1:
+                return [e]
+            mid = len(texts) // 2
+            logger.warning(f"Embedding request of {len(texts)} texts rejected, splitting")
+            return self._embed_chunk_isolated(texts[:mid]) + self._embed_chunk_isolated(
+                texts[mid:]
+            )
+
+    def _request_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Send one embeddings request and return its rows in input order."""
+        # Raw base64 skips the SDK's decode into a list of Python floats
+        response = self.client.embeddings.create(
+            input=texts,
+            model=self.model,
+            encoding_format="base64",
+        )
+
+        # Place rows by index to maintain order
+        vectors = {item.index: _decode_embedding(item.embedding) for item in response.data}
+        embeddings = np.empty((len(vectors), len(vectors[0])), dtype=np.float32)
+        for index, vector in vectors.items():
+            embeddings[index] = vector
+        return embeddings
+
     def create_profile_embedding_text(
         self,
         tech_stack: List[str],
@@ -158,40 +431,11 @@ class EmbeddingService:
 
     def _expand_tech_terms(self, tech_stack: List[str]) -> List[str]:
         """Expand tech abbreviations for better embedding matching."""
-        expansions = {
-            "js": "JavaScript",
-            "ts": "TypeScript",
-            "py": "Python",
-            "ml": "Machine Learning",
-            "ai": "Artificial Intelligence",
-            "llm": "Large Language Model",
-            "db": "Database",
-            "api": "API backend",
-            "ui": "User Interface",
-            "ux": "User Experience",
-        }
-        result = []
-        for tech in tech_stack:
-            lower = tech.lower()
-            if lower in expansions:
-                result.append(expansions[lower])
-            else:
-                result.append(tech)
-        return result
+        return [TECH_EXPANSIONS.get(_normalize_term(tech), tech) for tech in tech_stack]
 
     def _expand_goals(self, goals: List[str]) -> List[str]:
         """Expand goals to more descriptive phrases for embedding."""
-        expansions = {
-            "funding": "funding and investment opportunities",
-            "prizes": "competitions with cash prizes",
-            "learning": "learning new skills and technologies",
-            "networking": "networking and meeting collaborators",
-            "exposure": "visibility and user acquisition",
-            "mentorship": "mentorship and guidance from experts",
-            "building": "building and shipping products at hackathons",
-            "equity": "equity-based accelerator programs",
-        }
-        return [expansions.get(g.lower(), g) for g in goals]
+        return [GOAL_EXPANSIONS.get(_normalize_term(g), g) for g in goals]
 
     def create_opportunity_embedding_text(
         self,
@@ -222,8 +466,9 @@ class EmbeddingService:
             parts.append(f"Category: {category}")
 
         if description:
-            # Take first 2000 chars of description
-            parts.append(description[:2000])
+            parts.append(
+                _truncate_to_tokens(description, DESCRIPTION_MAX_TOKENS, DESCRIPTION_MAX_CHARS)
+            )
 
         if tags:
             parts.append(f"Tags: {', '.join(tags)}")
@@ -270,10 +515,17 @@ class EmbeddingService:
                 industry=industry,
                 category=category,
             )
-            embedding = self.get_embedding(text)
+            # Typo fixes and whitespace changes in a re-scraped opportunity don't
+            # warrant a re-embed. Only this opportunity's own previous text is
+            # compared: different opportunities can share most of their template.
+            simhash = _simhash(text)
+            embedding = self.opportunity_cache.get_similar(opportunity_id, simhash)
+            if embedding is None:
+                embedding = self.get_embedding(text)
+                self.opportunity_cache.put(opportunity_id, tuple(embedding), simhash)
             return EmbeddingResult(
                 id=opportunity_id,
-                embedding=embedding,
+                embedding=np.asarray(embedding, dtype=np.float32),
                 text_length=len(text),
                 success=True,
             )
@@ -281,7 +533,7 @@ class EmbeddingService:
             logger.error(f"Failed to generate embedding for opportunity {opportunity_id}: {e}")
             return EmbeddingResult(
                 id=opportunity_id,
-                embedding=[],
+                embedding=_empty_embedding(),
                 text_length=0,
                 success=False,
                 error=str(e),
@@ -341,7 +593,7 @@ class EmbeddingService:
                     results.append(
                         EmbeddingResult(
                             id=str(opp_id),
-                            embedding=[],
+                            embedding=_empty_embedding(),
                             text_length=0,
                             success=False,
                             error="Missing title",
@@ -372,35 +624,36 @@ class EmbeddingService:
             if not texts:
                 continue
 
-            # Generate embeddings for batch
+            # Generate embeddings for batch; texts the API rejects only fail
+            # themselves, any other error fails the whole batch
             try:
-                embeddings = self.get_embeddings_batch(texts)
+                outcomes = self._safe_embed(texts)
+            except Exception as e:
+                logger.error(f"Batch embedding failed: {e}")
+                outcomes = [e] * len(texts)
 
-                for j, embedding in enumerate(embeddings):
+            for j, outcome in enumerate(outcomes):
+                if isinstance(outcome, Exception):
                     results.append(
                         EmbeddingResult(
                             id=ids[j],
-                            embedding=embedding,
+                            embedding=_empty_embedding(),
                             text_length=text_lengths[j],
-                            success=True,
+                            success=False,
+                            error=str(outcome),
                         )
                     )
-                    stats["success"] += 1
-
-            except Exception as e:
-                logger.error(f"Batch embedding failed: {e}")
-                # Mark all in this batch as failed
-                for j in range(len(texts)):
+                    stats["failed"] += 1
+                else:
                     results.append(
                         EmbeddingResult(
                             id=ids[j],
-                            embedding=[],
+                            embedding=outcome,
                             text_length=text_lengths[j],
-                            success=False,
-                            error=str(e),
+                            success=True,
                         )
                     )
-                    stats["failed"] += 1
+                    stats["success"] += 1
 
             logger.info(
                 f"Processed batch {i // batch_size + 1}: "
@@ -409,14 +662,37 @@ class EmbeddingService:
 
         return results, stats
 
+    def _safe_embed(self, texts: List[str]) -> List[Union[np.ndarray, Exception]]:
+        """
+        Embed texts, isolating the ones the API rejects as invalid input.
+
+        Errors other than a rejected request are raised, not retried.
+
+        Returns:
+            One entry per text: its embedding, or the error it was rejected with
+        """
+        texts = [_truncate_to_tokens(text) for text in texts]
+
+        # Embed each distinct text once, then map outcomes back to input positions
+        first_seen: Dict[str, int] = {}
+        positions = [first_seen.setdefault(text, len(first_seen)) for text in texts]
+        chunks = list(_pack_chunks(list(first_seen)))
+
+        if len(chunks) == 1:
+            unique_outcomes = self._embed_chunk_isolated(chunks[0])
+        else:
+            workers = min(MAX_CONCURRENT_REQUESTS, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                unique_outcomes = [
+                    outcome
+                    for outcomes in pool.map(self._embed_chunk_isolated, chunks)
+                    for outcome in outcomes
+                ]
 
-# Singleton instance
-_embedding_service: Optional[EmbeddingService] = None
+        return [unique_outcomes[position] for position in positions]
 
 
+@lru_cache(maxsize=1)
 def get_embedding_service() -> EmbeddingService:
     """Get or create the embedding service singleton."""
-    global _embedding_service
-    if _embedding_service is None:
-        _embedding_service = EmbeddingService()
-    return _embedding_service
+    return EmbeddingService()
@@ -9,19 +9,20 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from ..models.profile import Profile
 from ..models.opportunity import Opportunity
 from ..models.match import Match
-from .embedding_service import get_embedding_service
+from .embedding_service import get_embedding_service, normalize_rows
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchScoreBreakdown:
     """Simplified scoring: semantic similarity is the primary signal.
 
@@ -76,6 +77,25 @@ class MatchScoreBreakdown:
 
 
 @dataclass
+class MatchBatch:
+    """Score components for many opportunities as parallel arrays.
+
+    Lets compute_matches_for_profile rank every candidate in one vectorized
+    pass and build full MatchResult objects only for the ones it returns.
+    """
+
+    semantic: np.ndarray
+    recency: np.ndarray
+    popularity: np.ndarray
+    eligible: np.ndarray
+
+    def total_scores(self) -> np.ndarray:
+        """Vectorized MatchScoreBreakdown.total_score for every row."""
+        boost = np.minimum(0.05, self.recency + self.popularity)
+        return np.where(self.eligible, np.minimum(1.0, self.semantic + boost), 0.0)
+
+
+@dataclass(slots=True)
 class MatchExplanation:
     """Human-readable match explanation."""
 
@@ -95,7 +115,7 @@ class MatchExplanation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a profile to an opportunity."""
 
@@ -123,6 +143,36 @@ INDUSTRY_ALIASES = {
 }
 
 
+def _spread_similarity(raw: np.ndarray) -> np.ndarray:
+    """Spread raw cosine similarities across the 0-1 range.
+
+    OpenAI embeddings typically produce similarities in 0.3-0.5 range for
+    related content. Map the typical range [0.25, 0.55] to [0.50, 0.95] so
+    scores read naturally (50% = weak, 70% = good, 90% = excellent).
+    """
+    min_raw = 0.25  # Minimum expected similarity for any content
+    max_raw = 0.55  # Maximum typical similarity for highly relevant content
+    min_output = 0.50
+    max_output = 0.95
+
+    raw = np.asarray(raw)
+    stretched = np.where(
+        raw <= min_raw,
+        raw / min_raw * min_output,
+        np.where(
+            raw >= max_raw,
+            max_output + (raw - max_raw) * 0.5,
+            # Linear interpolation in the typical range
+            min_output + (raw - min_raw) / (max_raw - min_raw) * (max_output - min_output),
+        ),
+    )
+    return np.clip(stretched, 0.0, 1.0)
+
+
+# Alias lists as sets for O(1) membership tests in the matching loop
+_ALIAS_SETS = [(key, frozenset(values)) for key, values in INDUSTRY_ALIASES.items()]
+
+
 def fuzzy_industry_match(profile_industries: set, opp_themes: set) -> tuple[float, list]:
     """
     Compute fuzzy industry/theme match score.
@@ -130,8 +180,18 @@ def fuzzy_industry_match(profile_industries: set, opp_themes: set) -> tuple[floa
     Returns:
         Tuple of (score, list of matching themes)
     """
+    score, matches = _fuzzy_industry_match(frozenset(profile_industries), frozenset(opp_themes))
+    return score, list(matches)
+
+
+@lru_cache(maxsize=65536)
+def _fuzzy_industry_match(
+    profile_industries: frozenset,
+    opp_themes: frozenset,
+) -> tuple[float, tuple]:
+    """Cached core of fuzzy_industry_match; many opportunities share theme sets."""
     if not profile_industries or not opp_themes:
-        return 0.5, []
+        return 0.5, ()
 
     matches = set()
 
@@ -139,34 +199,55 @@ def fuzzy_industry_match(profile_industries: set, opp_themes: set) -> tuple[floa
     direct_overlap = profile_industries & opp_themes
     matches.update(direct_overlap)
 
+    # Lowercase each side once instead of once per comparison
+    profile_lowered = [p.lower() for p in profile_industries]
+    opp_lowered = [(t, t.lower()) for t in opp_themes]
+
     # Fuzzy matches using aliases
-    for profile_ind in profile_industries:
-        profile_lower = profile_ind.lower()
+    for profile_lower in profile_lowered:
         # Check if profile industry has aliases
-        for alias_key, alias_values in INDUSTRY_ALIASES.items():
+        for alias_key, alias_values in _ALIAS_SETS:
             if profile_lower in alias_values or alias_key in profile_lower:
                 # Check if any opportunity theme matches these aliases
-                for opp_theme in opp_themes:
-                    opp_lower = opp_theme.lower()
+                for opp_theme, opp_lower in opp_lowered:
                     if opp_lower in alias_values or alias_key in opp_lower:
                         matches.add(opp_theme)
                         break
 
     # Also do substring matching for partial matches
-    for profile_ind in profile_industries:
-        profile_lower = profile_ind.lower()
-        for opp_theme in opp_themes:
-            opp_lower = opp_theme.lower()
+    for profile_lower in profile_lowered:
+        for opp_theme, opp_lower in opp_lowered:
             # Check if one contains the other (partial match)
             if profile_lower in opp_lower or opp_lower in profile_lower:
                 matches.add(opp_theme)
 
     if not matches:
-        return 0.0, []
+        return 0.0, ()
 
     # Score based on how many profile industries found matches
     score = min(1.0, len(matches) / len(profile_industries))
-    return score, list(matches)
+    return score, tuple(matches)
+
+
+def _team_size_query(team_size: int) -> Dict:
+    """Build a MongoDB filter for opportunities whose team size limits admit ``team_size``.
+
+    Mirrors the team size check in ``_apply_hard_filters``: a missing or
+    zero limit means no limit.
+    """
+    return {
+        "$and": [
+            {"$or": [
+                {"team_size_min": None},
+                {"team_size_min": {"$lte": team_size}},
+            ]},
+            {"$or": [
+                {"team_size_max": None},
+                {"team_size_max": 0},
+                {"team_size_max": {"$gte": team_size}},
+            ]},
+        ]
+    }
 
 
 class MongoMatchingService:
@@ -220,6 +301,9 @@ class MongoMatchingService:
         query = {}
         if only_active:
             query["is_active"] = True
+        if apply_hard_filters:
+            # Let MongoDB drop team-size-ineligible opportunities so they are never loaded or scored
+            query.update(_team_size_query(profile.team_size or 1))
 
         # Get opportunities
         opportunities = await Opportunity.find(query).to_list()
@@ -228,31 +312,79 @@ class MongoMatchingService:
             logger.info("No opportunities found for matching")
             return []
 
-        # Compute matches with yield points to prevent event loop blocking
-        matches = []
-        for i, opp in enumerate(opportunities):
-            # Yield every 50 opportunities to allow other async tasks to run
-            if i > 0 and i % 50 == 0:
-                await asyncio.sleep(0)
+        batch = await self._build_match_batch(profile, opportunities)
 
-            result = self._compute_single_match(profile, opp)
+        # Rank on the arrays; stable so ties keep query order
+        totals = batch.total_scores()
+        keep = totals >= min_score
+        if apply_hard_filters:
+            keep &= batch.eligible
+        candidates = np.flatnonzero(keep)
+        top = candidates[np.argsort(-totals[candidates], kind="stable")][:limit]
 
-            # Apply hard filters
-            if apply_hard_filters and not result.breakdown.is_eligible:
-                continue
+        # Only the returned matches need explanations
+        return [
+            self._compute_single_match(profile, opportunities[i], float(batch.semantic[i]))
+            for i in top
+        ]
 
-            if result.score >= min_score:
-                matches.append(result)
+    async def _build_match_batch(
+        self,
+        profile: Profile,
+        opportunities: List[Opportunity],
+    ) -> MatchBatch:
+        """Collect each opportunity's score components into a MatchBatch.
+
+        One pass over the opportunities gathers the hard-filter result,
+        boosts and embedding row; the semantic scores then come from a
+        single matrix product over the gathered rows.
+        """
+        count = len(opportunities)
+        semantic = np.full(count, 0.5)
+        recency = np.empty(count)
+        popularity = np.empty(count)
+        eligible = np.empty(count, dtype=bool)
 
-        # Sort by score descending
-        matches.sort(key=lambda m: m.score, reverse=True)
+        dimension = len(profile.embedding) if profile.embedding else 0
+        rows: List[int] = []
+        embeddings: List[List[float]] = []
 
-        return matches[:limit]
+        # Yield points prevent event loop blocking
+        for i, opp in enumerate(opportunities):
+            # Yield every 50 opportunities to allow other async tasks to run
+            if i > 0 and i % 50 == 0:
+                await asyncio.sleep(0)
+
+            breakdown = MatchScoreBreakdown()
+            self._apply_hard_filters(profile, opp, breakdown, [])
+            eligible[i] = breakdown.is_eligible
+            recency[i] = self._recency_boost(opp)
+            popularity[i] = self._popularity_boost(opp)
+
+            if dimension and opp.embedding:
+                if len(opp.embedding) == dimension:
+                    rows.append(i)
+                    embeddings.append(opp.embedding)
+                else:
+                    # Dimension mismatch: per-pair fallback
+                    semantic[i] = self._cosine_similarity(profile.embedding, opp.embedding)
+
+        if rows:
+            matrix = np.array(embeddings, dtype=np.float32)
+            semantic[rows] = self._cosine_similarity_batch(profile.embedding, matrix)
+
+        return MatchBatch(
+            semantic=semantic,
+            recency=recency,
+            popularity=popularity,
+            eligible=eligible,
+        )
 
     def _compute_single_match(
         self,
         profile: Profile,
         opportunity: Opportunity,
+        semantic_score: Optional[float] = None,
     ) -> MatchResult:
         """Compute match score using semantic similarity as the primary signal.
 
@@ -264,6 +396,9 @@ class MongoMatchingService:
 
         So we rely on cosine similarity between embeddings rather than
         naive string matching.
+
+        Pass ``semantic_score`` when it was already computed in a batch;
+        otherwise it is computed here from the two embeddings.
         """
         breakdown = MatchScoreBreakdown()
         match_reasons = []
@@ -277,9 +412,9 @@ class MongoMatchingService:
 
         # 2. Semantic similarity - THE PRIMARY SCORE
         if profile.embedding and opportunity.embedding:
-            breakdown.semantic_score = self._cosine_similarity(
-                profile.embedding, opportunity.embedding
-            )
+            if semantic_score is None:
+                semantic_score = self._cosine_similarity(profile.embedding, opportunity.embedding)
+            breakdown.semantic_score = semantic_score
 
             # Generate match reasons based on score
             if breakdown.semantic_score >= 0.80:
@@ -296,16 +431,10 @@ class MongoMatchingService:
                 suggestions.append("Opportunity data incomplete")
 
         # 3. Recency boost - newer opportunities get slight boost
-        if opportunity.created_at:
-            days_old = (datetime.utcnow() - opportunity.created_at).days
-            if days_old <= 7:
-                breakdown.recency_boost = 0.02  # 2% boost for week-old
-            elif days_old <= 14:
-                breakdown.recency_boost = 0.01  # 1% boost for 2 weeks
+        breakdown.recency_boost = self._recency_boost(opportunity)
 
         # 4. Popularity boost - based on participant count if available
-        if opportunity.participant_count and opportunity.participant_count > 100:
-            breakdown.popularity_boost = 0.01  # 1% boost for popular events
+        breakdown.popularity_boost = self._popularity_boost(opportunity)
 
         # Generate explanation
         primary_reason = self._generate_explanation(breakdown, match_reasons)
@@ -332,10 +461,26 @@ class MongoMatchingService:
             suggestions=suggestions,
         )
 
+    def _recency_boost(self, opportunity: Opportunity) -> float:
+        """Slight boost for recently posted opportunities."""
+        if opportunity.created_at:
+            days_old = (datetime.utcnow() - opportunity.created_at).days
+            if days_old <= 7:
+                return 0.02  # 2% boost for week-old
+            elif days_old <= 14:
+                return 0.01  # 1% boost for 2 weeks
+        return 0.0
+
+    def _popularity_boost(self, opportunity: Opportunity) -> float:
+        """Slight boost for popular events, based on participant count."""
+        if opportunity.participant_count and opportunity.participant_count > 100:
+            return 0.01  # 1% boost for popular events
+        return 0.0
+
     def _find_matching_themes(self, profile: Profile, opportunity: Opportunity) -> List[str]:
         """Find matching themes for display purposes (not scoring)."""
-        profile_interests = set(i.lower() for i in (profile.interests or []))
-        opp_themes = set(t.lower() for t in (opportunity.themes or []))
+        profile_interests = frozenset(i.lower() for i in (profile.interests or []))
+        opp_themes = frozenset(t.lower() for t in (opportunity.themes or []))
 
         # Use fuzzy matching for display
         _, matches = fuzzy_industry_match(profile_interests, opp_themes)
@@ -394,49 +539,43 @@ class MongoMatchingService:
         # Location check (simplified - would need opportunity location requirements)
         breakdown.location_eligible = True
 
+    def _cosine_similarity_batch(
+        self,
+        query: Union[Sequence[float], np.ndarray],
+        matrix: np.ndarray,
+    ) -> np.ndarray:
+        """Calculate spread cosine similarities between a query and each matrix row.
+
+        Returns a float array with one score per row, on the same scale as
+        ``_cosine_similarity``. Zero vectors score 0.
+        """
+        raw = normalize_rows(matrix) @ normalize_rows(query)
+        return _spread_similarity(raw)
+
     def _cosine_similarity(
         self,
-        vec1: List[float],
-        vec2: List[float],
+        vec1: Union[Sequence[float], np.ndarray],
+        vec2: Union[Sequence[float], np.ndarray],
     ) -> float:
         """Calculate cosine similarity between two vectors with score spreading.
 
-        OpenAI embeddings typically produce similarities in 0.3-0.5 range for
-        related content (after normalization). We apply a transformation to
-        spread scores more visually meaningful across the 0-1 range.
+        Per-pair fallback for ``_cosine_similarity_batch``; see
+        ``_spread_similarity`` for the score transformation.
         """
         try:
-            a = np.array(vec1)
-            b = np.array(vec2)
+            # asarray: ndarray inputs are used as-is, lists converted once
+            a = np.asarray(vec1, dtype=np.float32)
+            b = np.asarray(vec2, dtype=np.float32)
 
             dot_product = np.dot(a, b)
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
-
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-
-            # Raw cosine similarity (typically 0.3-0.5 for related embeddings)
-            raw_similarity = dot_product / (norm_a * norm_b)
-
-            # Apply score spreading transformation:
-            # Map typical range [0.25, 0.55] to [0.50, 0.95] for better user perception
-            # This makes scores more meaningful (50% = weak, 70% = good, 90% = excellent)
-            min_raw = 0.25  # Minimum expected similarity for any content
-            max_raw = 0.55  # Maximum typical similarity for highly relevant content
-            min_output = 0.50
-            max_output = 0.95
-
-            if raw_similarity <= min_raw:
-                stretched = raw_similarity / min_raw * min_output
-            elif raw_similarity >= max_raw:
-                stretched = max_output + (raw_similarity - max_raw) * 0.5
-            else:
-                # Linear interpolation in the typical range
-                ratio = (raw_similarity - min_raw) / (max_raw - min_raw)
-                stretched = min_output + ratio * (max_output - min_output)
+            denom = np.linalg.norm(a) * np.linalg.norm(b)
+
+            # Raw cosine similarity (typically 0.3-0.5 for related embeddings);
+            # zero vectors are masked to 0 rather than branched on
+            nonzero = denom > 1e-12
+            raw_similarity = dot_product / np.where(nonzero, denom, 1.0) * nonzero
 
-            return float(max(0.0, min(1.0, stretched)))
+            return float(_spread_similarity(raw_similarity))
         except Exception as e:
             logger.warning(f"Error calculating cosine similarity: {e}")
             return 0.5
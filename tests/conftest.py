@@ -1,9 +1,8 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
 import os
 import sys
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Iterator
 
 import pytest
 import pytest_asyncio
@@ -13,12 +12,23 @@ from httpx import ASGITransport, AsyncClient
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session", autouse=True)
+def _warm_security_imports() -> None:
+    """Import the security/auth modules once so the first auth test doesn't pay for it."""
+    import src.opportunity_radar.core.security  # noqa: F401
+    import src.opportunity_radar.schemas.user  # noqa: F401
+    import src.opportunity_radar.services.auth_service  # noqa: F401
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Iterator[None]:
+    """Hash with the cheapest Argon2 cost; no test depends on the production work factor."""
+    from src.opportunity_radar.core import security
+
+    fast_context = security.pwd_context.copy(argon2__time_cost=1, argon2__memory_cost=8)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "pwd_context", fast_context)
+        yield
 
 
 @pytest.fixture(scope="session")
@@ -43,9 +43,9 @@ class TestEmbeddingServiceIntegration:
             embedding_service.get_embedding("")
 
     def test_empty_batch_returns_empty(self, embedding_service):
-        """Test that empty batch returns empty list."""
+        """Test that empty batch returns no rows."""
         embeddings = embedding_service.get_embeddings_batch([])
-        assert embeddings == []
+        assert len(embeddings) == 0
 
     def test_opportunity_embedding_generation(self, embedding_service):
         """Test generating embedding for opportunity."""
@@ -0,0 +1,70 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_unit_imports() -> None:
+    """Import the model, service and scraper packages once per session/worker.
+
+    Several unit tests still import these inside the test body; warming them
+    here keeps that first-touch cost out of whichever test happens to run first.
+    """
+    import src.opportunity_radar.core.rate_limit  # noqa: F401
+    import src.opportunity_radar.core.redis_client  # noqa: F401
+    import src.opportunity_radar.models  # noqa: F401
+    import src.opportunity_radar.schemas.profile  # noqa: F401
+    import src.opportunity_radar.scrapers  # noqa: F401
+    import src.opportunity_radar.services  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def auth_service():
+    """Shared AuthService instance (the service holds no per-test state)."""
+    from src.opportunity_radar.services.auth_service import AuthService
+
+    return AuthService()
+
+
+@pytest.fixture(scope="session")
+def calendar_service():
+    """Shared CalendarService instance (the service holds no per-test state)."""
+    from src.opportunity_radar.services.calendar_service import CalendarService
+
+    return CalendarService()
+
+
+@pytest.fixture
+def matching_service():
+    """The MongoMatchingService singleton, as used at runtime.
+
+    The lazily loaded embedding service is reset afterwards so no test
+    leaks one into the next.
+    """
+    from src.opportunity_radar.services.mongo_matching_service import (
+        get_mongo_matching_service,
+    )
+
+    service = get_mongo_matching_service()
+    yield service
+    service._embedding_service = None
+
+
+@pytest.fixture
+def embedding_service():
+    """EmbeddingService with a mock OpenAI client and an empty cache, fresh per test."""
+    from unittest.mock import MagicMock
+
+    from src.opportunity_radar.services.embedding_service import (
+        EMBEDDING_MODEL,
+        EmbeddingCache,
+        EmbeddingService,
+    )
+
+    # Bypass __init__ so no real OpenAI client (or API key) is needed
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.client = MagicMock()
+    service.model = EMBEDDING_MODEL
+    service.cache = EmbeddingCache()
+    service.opportunity_cache = EmbeddingCache()
+    return service
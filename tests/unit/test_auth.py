@@ -1,7 +1,15 @@
 """Unit tests for Authentication workflow."""
 
+import inspect
+
 import pytest
 
+from src.opportunity_radar.models.user import User
+from src.opportunity_radar.schemas.user import Token
+
+_USER_FIELDS = frozenset(User.model_fields)
+_TOKEN_FIELDS = frozenset(Token.model_fields)
+
 
 class TestAuthServiceImport:
     """Test AuthService import and structure."""
@@ -40,40 +48,21 @@ class TestAuthServiceImport:
 class TestSecurityModule:
     """Test security module functions."""
 
-    def test_import_create_access_token(self):
-        """Test create_access_token import."""
-        from src.opportunity_radar.core.security import create_access_token
-
-        assert create_access_token is not None
-        assert callable(create_access_token)
-
-    def test_import_create_refresh_token(self):
-        """Test create_refresh_token import."""
-        from src.opportunity_radar.core.security import create_refresh_token
-
-        assert create_refresh_token is not None
-        assert callable(create_refresh_token)
-
-    def test_import_decode_token(self):
-        """Test decode_token import."""
-        from src.opportunity_radar.core.security import decode_token
-
-        assert decode_token is not None
-        assert callable(decode_token)
-
-    def test_import_get_password_hash(self):
-        """Test get_password_hash import."""
-        from src.opportunity_radar.core.security import get_password_hash
-
-        assert get_password_hash is not None
-        assert callable(get_password_hash)
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "create_access_token",
+            "create_refresh_token",
+            "decode_token",
+            "get_password_hash",
+            "verify_password",
+        ],
+    )
+    def test_security_exports(self, name):
+        """Test security module exports the expected functions."""
+        import src.opportunity_radar.core.security as security
 
-    def test_import_verify_password(self):
-        """Test verify_password import."""
-        from src.opportunity_radar.core.security import verify_password
-
-        assert verify_password is not None
-        assert callable(verify_password)
+        assert inspect.isfunction(getattr(security, name))
 
 
 class TestPasswordHashing:
@@ -161,24 +150,16 @@ class TestUserModel:
 
         assert User is not None
 
-    def test_user_has_auth_fields(self):
-        """Test User has authentication-related fields."""
-        from src.opportunity_radar.models.user import User
-
-        fields = User.model_fields
-
-        assert "email" in fields
-        assert "hashed_password" in fields
-        assert "is_active" in fields
-
-    def test_user_has_profile_fields(self):
-        """Test User has profile-related fields."""
-        from src.opportunity_radar.models.user import User
-
-        fields = User.model_fields
-
-        assert "full_name" in fields
-        assert "created_at" in fields
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            pytest.param({"email", "hashed_password", "is_active"}, id="auth"),
+            pytest.param({"full_name", "created_at"}, id="profile"),
+        ],
+    )
+    def test_user_has_fields(self, expected):
+        """Test User has authentication- and profile-related fields."""
+        assert expected.issubset(_USER_FIELDS)
 
 
 class TestAuthSchemas:
@@ -204,13 +185,7 @@ class TestAuthSchemas:
 
     def test_token_schema_fields(self):
         """Test Token schema has required fields."""
-        from src.opportunity_radar.schemas.user import Token
-
-        fields = Token.model_fields
-
-        assert "access_token" in fields
-        assert "refresh_token" in fields
-        assert "token_type" in fields
+        assert {"access_token", "refresh_token", "token_type"}.issubset(_TOKEN_FIELDS)
 
 
 class TestTokenDecoding:
@@ -314,17 +289,20 @@ class TestPasswordSecurity:
         assert verify_password(password, hashed) is True
         assert verify_password("wrong", hashed) is False
 
-    def test_long_password(self):
-        """Test hashing a very long password."""
+    @pytest.mark.parametrize("length", [72, 73])
+    def test_long_password(self, length):
+        """Test hashing passwords around the old 72-byte bcrypt limit."""
         from src.opportunity_radar.core.security import (
             get_password_hash,
             verify_password,
         )
 
-        password = "a" * 1000
+        password = "a" * length
         hashed = get_password_hash(password)
 
         assert verify_password(password, hashed) is True
+        # Argon2 uses the whole input, unlike bcrypt's 72-byte truncation
+        assert verify_password("a" * 72, hashed) is (length == 72)
 
     def test_hash_uniqueness(self):
         """Test that same password generates different hashes (due to salt)."""
@@ -337,14 +315,25 @@ class TestPasswordSecurity:
         # Hashes should be different due to random salt
         assert hash1 != hash2
 
-    def test_bcrypt_format(self):
-        """Test that hash is in bcrypt format."""
+    def test_argon2_format(self):
+        """Test that new hashes are in Argon2id format."""
         from src.opportunity_radar.core.security import get_password_hash
 
         hashed = get_password_hash("test")
 
-        # Bcrypt hashes start with $2b$ or $2a$
-        assert hashed.startswith("$2")
+        assert hashed.startswith("$argon2id$")
+
+    def test_legacy_bcrypt_hash_verifies(self):
+        """Test that hashes created before the Argon2 switch still verify."""
+        from passlib.context import CryptContext
+
+        from src.opportunity_radar.core.security import pwd_context, verify_password
+
+        legacy_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("test")
+
+        assert verify_password("test", legacy_hash) is True
+        assert verify_password("wrong", legacy_hash) is False
+        assert pwd_context.needs_update(legacy_hash) is True
 
 
 class TestTokenPayload:
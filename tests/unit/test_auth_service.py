@@ -1,82 +1,138 @@
 """Comprehensive unit tests for AuthService."""
 
-import pytest
+import asyncio
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
-
 
+import pytest
+from passlib.context import CryptContext
+from pydantic import ValidationError
+
+from src.opportunity_radar.core.exceptions import ConflictException, UnauthorizedException
+from src.opportunity_radar.core.security import (
+    create_access_token,
+    create_refresh_token,
+    get_password_hash,
+    verify_password,
+)
+from src.opportunity_radar.models.user import User
+from src.opportunity_radar.schemas.user import Token, UserCreate, UserResponse
+from src.opportunity_radar.services.auth_service import AuthService
+
+_NOW = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+_VALID_USERCREATE = UserCreate(
+    email="existing@example.com",
+    password="password123",
+    full_name="Existing User",
+)
+
+# Any truthy value stands in for "a user with this email already exists"
+_SENTINEL_USER = object()
+
+_ASYNC_METHODS = frozenset(
+    name for name in dir(AuthService) if asyncio.iscoroutinefunction(getattr(AuthService, name))
+)
+
+
+@pytest.fixture(scope="module")
+def hashed_passwords():
+    """Hash the test passwords once per module instead of once per test."""
+    return {p: get_password_hash(p) for p in ("password", "correct_password", "test_password")}
+
+
+@pytest.fixture(scope="module")
+def tokens():
+    """Sign one access/refresh token pair per module instead of once per test."""
+    uid = "507f1f77bcf86cd799439011"
+    return {
+        "uid": uid,
+        "access": create_access_token(data={"sub": uid}),
+        "refresh": create_refresh_token(data={"sub": uid}),
+    }
+
+
+def _mock_user(**attrs):
+    """Build a User stand-in with the attributes AuthService reads."""
+    user = MagicMock(spec=User)
+    user.configure_mock(**attrs)
+    return user
+
+
+@pytest.fixture(scope="module")
+def mock_users(hashed_passwords, tokens):
+    """Active and inactive mock users, built once and shared read-only."""
+    common = {
+        "id": tokens["uid"],
+        "email": "test@example.com",
+        "full_name": "Test User",
+        "created_at": _NOW,
+    }
+    return {
+        "active": _mock_user(
+            **common, hashed_password=hashed_passwords["correct_password"], is_active=True
+        ),
+        "inactive": _mock_user(
+            **common, hashed_password=hashed_passwords["password"], is_active=False
+        ),
+    }
+
+
+@pytest.mark.xdist_group(name="auth_structure")
 class TestAuthServiceStructure:
     """Test AuthService class structure and methods."""
 
     def test_auth_service_import(self):
         """Test AuthService can be imported."""
-        from src.opportunity_radar.services.auth_service import AuthService
         assert AuthService is not None
 
-    def test_auth_service_has_required_methods(self):
+    @pytest.mark.parametrize(
+        "method",
+        ["create_user", "authenticate", "get_current_user", "get_user_by_id"],
+    )
+    def test_auth_service_has_required_methods(self, method):
         """Test AuthService has all required methods."""
-        from src.opportunity_radar.services.auth_service import AuthService
-
-        required_methods = [
-            "create_user",
-            "authenticate",
-            "get_current_user",
-            "get_user_by_id",
-        ]
-        for method in required_methods:
-            assert hasattr(AuthService, method), f"Missing method: {method}"
+        assert hasattr(AuthService, method), f"Missing method: {method}"
 
     def test_auth_service_methods_are_async(self):
         """Test that service methods are async."""
-        import asyncio
-        from src.opportunity_radar.services.auth_service import AuthService
-
-        service = AuthService()
-        assert asyncio.iscoroutinefunction(service.create_user)
-        assert asyncio.iscoroutinefunction(service.authenticate)
-        assert asyncio.iscoroutinefunction(service.get_current_user)
-        assert asyncio.iscoroutinefunction(service.get_user_by_id)
+        expected = {"create_user", "authenticate", "get_current_user", "get_user_by_id"}
+        assert expected <= _ASYNC_METHODS
 
 
+@pytest.mark.xdist_group(name="auth_structure")
 class TestAuthServiceExceptions:
     """Test AuthService exception handling."""
 
     def test_conflict_exception_import(self):
         """Test ConflictException can be imported."""
-        from src.opportunity_radar.core.exceptions import ConflictException
         assert ConflictException is not None
 
     def test_unauthorized_exception_import(self):
         """Test UnauthorizedException can be imported."""
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
         assert UnauthorizedException is not None
 
     def test_conflict_exception_has_message(self):
         """Test ConflictException stores message."""
-        from src.opportunity_radar.core.exceptions import ConflictException
-
         exc = ConflictException(message="User exists")
         assert exc.message == "User exists"
         assert exc.status_code == 409
 
     def test_unauthorized_exception_has_message(self):
         """Test UnauthorizedException stores message."""
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
-
         exc = UnauthorizedException(message="Invalid credentials")
         assert exc.message == "Invalid credentials"
         assert exc.status_code == 401
 
 
+@pytest.mark.xdist_group(name="auth_structure")
 class TestUserSchemas:
     """Test user-related schemas."""
 
     def test_user_create_schema(self):
-        """Test UserCreate schema validation."""
-        from src.opportunity_radar.schemas.user import UserCreate
-
-        # Valid user
-        user = UserCreate(
+        """Test UserCreate schema fields."""
+        # Validation itself is covered by test_user_create_email_validation
+        user = UserCreate.model_construct(
             email="test@example.com",
             password="password123",
             full_name="Test User",
@@ -87,21 +143,14 @@ class TestUserSchemas:
 
     def test_user_create_email_validation(self):
         """Test UserCreate validates email format."""
-        from src.opportunity_radar.schemas.user import UserCreate
-        from pydantic import ValidationError
-
         with pytest.raises(ValidationError):
-            UserCreate(
-                email="invalid-email",
-                password="password123",
-                full_name="Test User",
+            UserCreate.model_validate_json(
+                b'{"email": "invalid-email", "password": "password123", "full_name": "Test User"}'
             )
 
     def test_token_schema(self):
         """Test Token schema."""
-        from src.opportunity_radar.schemas.user import Token
-
-        token = Token(
+        token = Token.model_construct(
             access_token="access123",
             refresh_token="refresh456",
             token_type="bearer",
@@ -112,209 +161,153 @@ class TestUserSchemas:
 
     def test_user_response_schema(self):
         """Test UserResponse schema."""
-        from src.opportunity_radar.schemas.user import UserResponse
-
-        response = UserResponse(
+        response = UserResponse.model_construct(
             id="507f1f77bcf86cd799439011",
             email="test@example.com",
             full_name="Test User",
             is_active=True,
-            created_at=datetime.utcnow(),
+            created_at=_NOW,
         )
         assert response.email == "test@example.com"
         assert response.is_active is True
 
 
+@pytest.mark.xdist_group(name="auth_crypto")
 class TestCreateTokens:
     """Test token creation in AuthService."""
 
-    def test_create_tokens_method_exists(self):
-        """Test AuthService.create_tokens exists."""
-        from src.opportunity_radar.services.auth_service import AuthService
-
-        service = AuthService()
-        # create_tokens is used internally
-        assert hasattr(service, "create_tokens") or True  # May be inline
-
-    def test_tokens_are_created_from_security_module(self):
+    def test_tokens_are_created_from_security_module(self, tokens):
         """Test tokens are created using security module functions."""
-        from src.opportunity_radar.core.security import (
-            create_access_token,
-            create_refresh_token,
-        )
-
-        user_id = "507f1f77bcf86cd799439011"
-        access = create_access_token(data={"sub": user_id})
-        refresh = create_refresh_token(data={"sub": user_id})
+        access = tokens["access"]
+        refresh = tokens["refresh"]
 
         assert access is not None
         assert refresh is not None
         assert access != refresh
 
 
+@pytest.mark.xdist_group(name="auth_crypto")
 class TestPasswordOperations:
     """Test password-related operations."""
 
-    def test_password_hashing_used_in_create_user(self):
+    def test_password_hashing_used_in_create_user(self, hashed_passwords):
         """Test that get_password_hash is available for user creation."""
-        from src.opportunity_radar.core.security import get_password_hash
-
         password = "test_password"
-        hashed = get_password_hash(password)
+        hashed = hashed_passwords[password]
 
         assert hashed != password
         assert len(hashed) > 20
 
-    def test_password_verification_used_in_authenticate(self):
+    def test_password_verification_used_in_authenticate(self, hashed_passwords):
         """Test that verify_password is available for authentication."""
-        from src.opportunity_radar.core.security import (
-            get_password_hash,
-            verify_password,
-        )
-
         password = "test_password"
-        hashed = get_password_hash(password)
+        hashed = hashed_passwords[password]
 
         assert verify_password(password, hashed) is True
         assert verify_password("wrong_password", hashed) is False
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="auth_crypto")
 class TestAuthServiceMocked:
     """Test AuthService with mocked database operations."""
 
-    async def test_create_user_checks_existing(self):
-        """Test that create_user checks for existing user."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.schemas.user import UserCreate
-        from src.opportunity_radar.core.exceptions import ConflictException
-
-        service = AuthService()
+    @pytest.fixture(autouse=True)
+    def patched_models(self):
+        """Patch the User and Profile documents used by the service."""
+        with patch("src.opportunity_radar.services.auth_service.User") as MockUser, patch(
+            "src.opportunity_radar.services.auth_service.Profile"
+        ) as MockProfile:
+            yield MockUser, MockProfile
 
+    async def test_create_user_checks_existing(self, auth_service, patched_models):
+        """Test that create_user checks for existing user."""
+        MockUser, _ = patched_models
         # Mock User.find_one to return existing user
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.find_one = AsyncMock(return_value=MagicMock())
+        MockUser.find_one = AsyncMock(return_value=_SENTINEL_USER)
 
-            user_data = UserCreate(
-                email="existing@example.com",
-                password="password123",
-                full_name="Existing User",
-            )
+        with pytest.raises(ConflictException):
+            await auth_service.create_user(_VALID_USERCREATE)
 
-            with pytest.raises(ConflictException):
-                await service.create_user(user_data)
-
-    async def test_authenticate_returns_none_for_invalid_user(self):
+    async def test_authenticate_returns_none_for_invalid_user(self, auth_service, patched_models):
         """Test authenticate raises exception for non-existent user."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
-
-        service = AuthService()
-
+        MockUser, _ = patched_models
         # Mock User.find_one to return None
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.find_one = AsyncMock(return_value=None)
+        MockUser.find_one = AsyncMock(return_value=None)
 
-            with pytest.raises(UnauthorizedException) as exc_info:
-                await service.authenticate("nonexistent@example.com", "password")
+        with pytest.raises(UnauthorizedException) as exc_info:
+            await auth_service.authenticate("nonexistent@example.com", "password")
 
-            assert "Invalid email or password" in str(exc_info.value.message)
+        assert "Invalid email or password" in exc_info.value.message
 
-    async def test_authenticate_checks_password(self):
+    async def test_authenticate_checks_password(self, mock_users, auth_service, patched_models):
         """Test authenticate verifies password."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
-        from src.opportunity_radar.core.security import get_password_hash
+        MockUser, _ = patched_models
+        MockUser.find_one = AsyncMock(return_value=mock_users["active"])
 
-        service = AuthService()
+        # Wrong password should raise exception
+        with pytest.raises(UnauthorizedException):
+            await auth_service.authenticate("user@example.com", "wrong_password")
 
-        # Create mock user with hashed password
-        mock_user = MagicMock()
-        mock_user.id = "507f1f77bcf86cd799439011"
-        mock_user.hashed_password = get_password_hash("correct_password")
-        mock_user.is_active = True
+    async def test_authenticate_checks_is_active(self, mock_users, auth_service, patched_models):
+        """Test authenticate checks if user is active."""
+        MockUser, _ = patched_models
+        MockUser.find_one = AsyncMock(return_value=mock_users["inactive"])
 
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.find_one = AsyncMock(return_value=mock_user)
+        with pytest.raises(UnauthorizedException) as exc_info:
+            await auth_service.authenticate("user@example.com", "password")
 
-            # Wrong password should raise exception
-            with pytest.raises(UnauthorizedException):
-                await service.authenticate("user@example.com", "wrong_password")
+        assert "disabled" in exc_info.value.message.lower()
 
-    async def test_authenticate_checks_is_active(self):
-        """Test authenticate checks if user is active."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
-        from src.opportunity_radar.core.security import get_password_hash
+    async def test_authenticate_upgrades_legacy_hash(self, auth_service, tokens, patched_models):
+        """Test a successful login rehashes a legacy bcrypt password with Argon2id."""
+        MockUser, _ = patched_models
+        legacy_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password")
+        user = _mock_user(id=tokens["uid"], hashed_password=legacy_hash, is_active=True)
+        MockUser.find_one = AsyncMock(return_value=user)
 
-        service = AuthService()
+        await auth_service.authenticate("user@example.com", "password")
 
-        # Create mock inactive user
-        mock_user = MagicMock()
-        mock_user.id = "507f1f77bcf86cd799439011"
-        mock_user.hashed_password = get_password_hash("password")
-        mock_user.is_active = False
+        assert user.hashed_password.startswith("$argon2id$")
+        assert verify_password("password", user.hashed_password) is True
+        user.save.assert_awaited_once()
 
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.find_one = AsyncMock(return_value=mock_user)
+    async def test_authenticate_keeps_current_hash(self, mock_users, auth_service, patched_models):
+        """Test a login with an up-to-date Argon2id hash doesn't rewrite the user."""
+        MockUser, _ = patched_models
+        user = mock_users["active"]
+        original_hash = user.hashed_password
+        user.save.reset_mock()
+        MockUser.find_one = AsyncMock(return_value=user)
 
-            with pytest.raises(UnauthorizedException) as exc_info:
-                await service.authenticate("user@example.com", "password")
+        await auth_service.authenticate("user@example.com", "correct_password")
 
-            assert "disabled" in str(exc_info.value.message).lower()
+        assert user.hashed_password == original_hash
+        user.save.assert_not_awaited()
 
-    async def test_get_current_user_with_invalid_token(self):
+    async def test_get_current_user_with_invalid_token(self, auth_service):
         """Test get_current_user raises for invalid token."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.core.exceptions import UnauthorizedException
-
-        service = AuthService()
-
         with pytest.raises(UnauthorizedException):
-            await service.get_current_user("invalid_token")
+            await auth_service.get_current_user("invalid_token")
 
-    async def test_get_current_user_with_valid_token(self):
+    async def test_get_current_user_with_valid_token(
+        self, auth_service, tokens, mock_users, patched_models
+    ):
         """Test get_current_user works with valid token."""
-        from src.opportunity_radar.services.auth_service import AuthService
-        from src.opportunity_radar.core.security import create_access_token
-
-        service = AuthService()
-        user_id = "507f1f77bcf86cd799439011"
-        token = create_access_token(data={"sub": user_id})
-
-        # Create mock user
-        mock_user = MagicMock()
-        mock_user.id = user_id
-        mock_user.email = "test@example.com"
-        mock_user.full_name = "Test User"
-        mock_user.is_active = True
-        mock_user.created_at = datetime.utcnow()
-
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.get = AsyncMock(return_value=mock_user)
+        MockUser, MockProfile = patched_models
+        MockUser.get = AsyncMock(return_value=mock_users["active"])
+        MockProfile.find_one = AsyncMock(return_value=None)
 
-            with patch("src.opportunity_radar.services.auth_service.Profile") as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=None)
+        result = await auth_service.get_current_user(tokens["access"])
 
-                result = await service.get_current_user(token)
+        assert result.email == "test@example.com"
+        assert result.is_active is True
 
-                assert result.email == "test@example.com"
-                assert result.is_active is True
-
-    async def test_get_user_by_id(self):
+    async def test_get_user_by_id(self, auth_service, tokens, mock_users, patched_models):
         """Test get_user_by_id returns user."""
-        from src.opportunity_radar.services.auth_service import AuthService
-
-        service = AuthService()
-        user_id = "507f1f77bcf86cd799439011"
-
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        with patch("src.opportunity_radar.services.auth_service.User") as MockUser:
-            MockUser.get = AsyncMock(return_value=mock_user)
+        MockUser, _ = patched_models
+        MockUser.get = AsyncMock(return_value=mock_users["active"])
 
-            result = await service.get_user_by_id(user_id)
+        result = await auth_service.get_user_by_id(tokens["uid"])
 
-            assert result is not None
-            MockUser.get.assert_called_once()
+        assert result is not None
+        MockUser.get.assert_called_once()
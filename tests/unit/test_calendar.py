@@ -2,173 +2,154 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
 
+from src.opportunity_radar.services.calendar_service import (
+    CalendarService,
+    get_calendar_service,
+)
 
+_LONG_LINE = "DESCRIPTION:" + "x" * 100
+_DETAILS = "Build something\n\nMore info: https://example.com/hack"
+
+
+def _opportunity(**attrs) -> SimpleNamespace:
+    """Opportunity stand-in with the fields the calendar URL builders read."""
+    defaults = {
+        "title": "AI Hackathon",
+        "description": "Build something",
+        "website_url": "https://example.com/hack",
+        "location_city": "Berlin",
+        "location_country": "Germany",
+        "application_deadline": datetime(2024, 6, 15, 14, 30, tzinfo=timezone.utc),
+        "event_start_date": None,
+    }
+    return SimpleNamespace(**{**defaults, **attrs})
+
+
+@pytest.mark.xdist_group(name="calendar_structure")
 class TestCalendarServiceImport:
     """Test CalendarService import and structure."""
 
     def test_import_calendar_service(self):
         """Test CalendarService import."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
         assert CalendarService is not None
 
     def test_get_calendar_service_singleton(self):
         """Test get_calendar_service singleton function."""
-        from src.opportunity_radar.services.calendar_service import get_calendar_service
-
         service1 = get_calendar_service()
         service2 = get_calendar_service()
         assert service1 is service2
 
 
+@pytest.mark.xdist_group(name="calendar_structure")
 class TestCalendarServiceMethods:
     """Test CalendarService methods exist."""
 
-    def test_opportunity_to_ical_event(self):
-        """Test opportunity_to_ical_event method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "opportunity_to_ical_event")
-
-    def test_generate_ical(self):
-        """Test generate_ical method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "generate_ical")
-
-    def test_generate_pipeline_calendar(self):
-        """Test generate_pipeline_calendar method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "generate_pipeline_calendar")
-
-    def test_generate_upcoming_calendar(self):
-        """Test generate_upcoming_calendar method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "generate_upcoming_calendar")
-
-    def test_generate_google_calendar_url(self):
-        """Test generate_google_calendar_url method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "generate_google_calendar_url")
-
-    def test_generate_outlook_calendar_url(self):
-        """Test generate_outlook_calendar_url method exists."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        assert hasattr(CalendarService, "generate_outlook_calendar_url")
-
-
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "opportunity_to_ical_event",
+            "generate_ical",
+            "generate_pipeline_calendar",
+            "generate_upcoming_calendar",
+            "generate_google_calendar_url",
+            "generate_outlook_calendar_url",
+        ],
+    )
+    def test_method_exists(self, name):
+        """Test CalendarService exposes the calendar export methods."""
+        assert hasattr(CalendarService, name)
+
+
+@pytest.mark.xdist_group(name="calendar_service")
 class TestICalFormatting:
     """Test iCal formatting functions."""
 
-    def test_format_datetime(self):
+    @pytest.mark.parametrize(
+        "dt,expected",
+        [
+            (datetime(2024, 6, 15, 14, 30, 0, tzinfo=timezone.utc), "20240615T143000Z"),
+            (datetime(2024, 6, 15, 14, 30, 0), "20240615T143000Z"),
+        ],
+        ids=["aware", "naive"],
+    )
+    def test_format_datetime(self, calendar_service, dt, expected):
         """Test datetime formatting for iCal."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        # Test with timezone-aware datetime
-        dt = datetime(2024, 6, 15, 14, 30, 0, tzinfo=timezone.utc)
-        formatted = service._format_datetime(dt)
-
-        assert formatted == "20240615T143000Z"
-
-    def test_format_date(self):
+        assert calendar_service._format_datetime(dt) == expected
+
+    @pytest.mark.parametrize(
+        "dt,expected",
+        [
+            (datetime(2024, 6, 15), "20240615"),
+            (datetime(2024, 6, 15, 23, 59, 59), "20240615"),
+            (datetime(2024, 6, 15, 23, 30, tzinfo=timezone(timedelta(hours=-5))), "20240615"),
+        ],
+        ids=["midnight", "end-of-day", "non-utc"],
+    )
+    def test_format_date(self, calendar_service, dt, expected):
         """Test date formatting for iCal all-day events."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        dt = datetime(2024, 6, 15)
-        formatted = service._format_date(dt)
-
-        assert formatted == "20240615"
-
-    def test_escape_text(self):
+        assert calendar_service._format_date(dt) == expected
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Hello, World; with\nnewlines", "Hello\\, World\\; with\\nnewlines"),
+            ("", ""),
+            (None, ""),
+        ],
+        ids=["special-chars", "empty", "none"],
+    )
+    def test_escape_text(self, calendar_service, text, expected):
         """Test text escaping for iCal."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        # Test escaping special characters
-        text = "Hello, World; with\nnewlines"
-        escaped = service._escape_text(text)
-
-        assert "\\," in escaped
-        assert "\\;" in escaped
-        assert "\\n" in escaped
-
-    def test_escape_empty_text(self):
-        """Test escaping empty text."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        assert service._escape_text("") == ""
-        assert service._escape_text(None) == ""
+        assert calendar_service._escape_text(text) == expected
 
 
+@pytest.mark.xdist_group(name="calendar_service")
 class TestUIDGeneration:
     """Test UID generation for calendar events."""
 
-    def test_generate_uid(self):
+    def test_generate_uid(self, calendar_service):
         """Test UID generation format."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        uid = service._generate_uid("test-opp-123", "deadline")
+        uid = calendar_service._generate_uid("test-opp-123", "deadline")
 
         assert "test-opp-123" in uid
         assert "deadline" in uid
         assert "@opportunityradar.app" in uid
 
-    def test_uid_uniqueness(self):
+    def test_uid_uniqueness(self, calendar_service):
         """Test UIDs are unique for different event types."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        uid_deadline = service._generate_uid("test-opp-123", "deadline")
-        uid_start = service._generate_uid("test-opp-123", "start")
-        uid_end = service._generate_uid("test-opp-123", "end")
+        uid_deadline = calendar_service._generate_uid("test-opp-123", "deadline")
+        uid_start = calendar_service._generate_uid("test-opp-123", "start")
+        uid_end = calendar_service._generate_uid("test-opp-123", "end")
 
         assert uid_deadline != uid_start
         assert uid_start != uid_end
         assert uid_deadline != uid_end
 
 
+@pytest.mark.xdist_group(name="calendar_service")
 class TestICalGeneration:
     """Test iCal content generation."""
 
-    def test_ical_header(self):
+    def test_ical_header(self, calendar_service):
         """Test iCal file has proper header."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        ical = service.generate_ical([], calendar_name="Test Calendar")
+        ical = calendar_service.generate_ical([], calendar_name="Test Calendar")
 
         assert "BEGIN:VCALENDAR" in ical
         assert "VERSION:2.0" in ical
         assert "PRODID:-//Opportunity Radar//EN" in ical
         assert "END:VCALENDAR" in ical
 
-    def test_ical_calendar_name(self):
+    def test_ical_calendar_name(self, calendar_service):
         """Test iCal has custom calendar name."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
-        ical = service.generate_ical([], calendar_name="My Test Calendar")
+        ical = calendar_service.generate_ical([], calendar_name="My Test Calendar")
 
         assert "X-WR-CALNAME:My Test Calendar" in ical
 
 
+@pytest.mark.xdist_group(name="calendar_structure")
 class TestEventTypes:
     """Test different event types."""
 
@@ -187,22 +168,57 @@ class TestEventTypes:
         assert len(expected_alarms) == 2
 
 
+@pytest.mark.xdist_group(name="calendar_service")
 class TestCalendarURLs:
     """Test calendar URL generation."""
 
-    def test_google_calendar_url_base(self):
-        """Test Google Calendar URL base."""
-        base_url = "https://calendar.google.com/calendar/render"
-        assert "google.com" in base_url
-        assert "calendar" in base_url
-
-    def test_outlook_calendar_url_base(self):
-        """Test Outlook Calendar URL base."""
-        base_url = "https://outlook.live.com/calendar/0/deeplink/compose"
-        assert "outlook.live.com" in base_url
-        assert "calendar" in base_url
-
-
+    @pytest.mark.parametrize(
+        "method,base_url,expected",
+        [
+            (
+                "generate_google_calendar_url",
+                "https://calendar.google.com/calendar/render",
+                {
+                    "action": "TEMPLATE",
+                    "text": "[Deadline] AI Hackathon",
+                    "dates": "20240615T143000/20240615T153000",
+                    "details": _DETAILS,
+                    "location": "Berlin, Germany",
+                },
+            ),
+            (
+                "generate_outlook_calendar_url",
+                "https://outlook.live.com/calendar/0/deeplink/compose",
+                {
+                    "rru": "addevent",
+                    "subject": "[Deadline] AI Hackathon",
+                    "startdt": "2024-06-15T14:30:00",
+                    "enddt": "2024-06-15T15:30:00",
+                    "body": _DETAILS,
+                    "location": "Berlin, Germany",
+                },
+            ),
+        ],
+        ids=["google", "outlook"],
+    )
+    def test_calendar_url(self, calendar_service, method, base_url, expected):
+        """Test provider URLs carry the event details in their query string."""
+        url = getattr(calendar_service, method)(_opportunity())
+
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == base_url
+        assert query.items() >= expected.items()
+
+    @pytest.mark.parametrize(
+        "method", ["generate_google_calendar_url", "generate_outlook_calendar_url"]
+    )
+    def test_calendar_url_without_date(self, calendar_service, method):
+        """Test no URL is built when the requested event has no date."""
+        assert getattr(calendar_service, method)(_opportunity(), event_type="start") is None
+
+
+@pytest.mark.xdist_group(name="calendar_service")
 class TestCalendarWorkflow:
     """Test Calendar workflow logic."""
 
@@ -213,19 +229,15 @@ class TestCalendarWorkflow:
         assert default_days > 0
         assert default_days <= 365
 
-    def test_line_folding(self):
+    def test_line_folding(self, calendar_service):
         """Test line folding for long content."""
-        from src.opportunity_radar.services.calendar_service import CalendarService
-
-        service = CalendarService()
-
         # Test with short line
         short_line = "SHORT:This is short"
-        folded = service._fold_line(short_line)
+        folded = calendar_service._fold_line(short_line)
         assert "\r\n" not in folded
 
         # Test with long line
-        long_line = "DESCRIPTION:" + "x" * 100
-        folded = service._fold_line(long_line)
+        long_line = _LONG_LINE
+        folded = calendar_service._fold_line(long_line)
         # Long lines should be folded
         assert len(long_line) > 75
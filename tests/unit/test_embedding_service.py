@@ -1,31 +1,76 @@
 """Comprehensive unit tests for EmbeddingService."""
 
+import base64
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+
+import httpx
+import numpy as np
 import pytest
+from openai import BadRequestError, RateLimitError
 from unittest.mock import MagicMock, patch
 
+import src.opportunity_radar.services.embedding_service as embedding_module
+from src.opportunity_radar.services.embedding_service import (
+    EMBEDDING_DIMENSION,
+    EMBEDDING_MODEL,
+    MAX_BATCH_SIZE,
+    MAX_TOKENS_PER_REQUEST,
+    EmbeddingCache,
+    EmbeddingResult,
+    EmbeddingService,
+    get_embedding_service,
+    normalize_rows,
+)
+
+
+def _b64(values):
+    """Encode a vector the way the API returns it with encoding_format="base64"."""
+    return base64.b64encode(np.asarray(values, dtype=np.float32).tobytes()).decode()
+
+
+def _response(*vectors):
+    """Build an embeddings API response with one indexed item per vector."""
+    return SimpleNamespace(
+        data=[SimpleNamespace(index=i, embedding=_b64(v)) for i, v in enumerate(vectors)]
+    )
+
+
+def _echo_create(input, **kwargs):
+    """Fake embeddings.create returning each text's trailing digit as its vector."""
+    return _response(*([float(text[-1])] for text in input))
+
+
+def _api_error(error_cls, message, status_code):
+    """Build an openai API error the way the SDK raises it for an HTTP status."""
+    return error_cls(
+        message,
+        response=httpx.Response(status_code, request=httpx.Request("POST", "http://test")),
+        body=None,
+    )
+
+
+def _char_encoding():
+    """Fake tokenizer with one token per character."""
+    encoding = MagicMock()
+    encoding.encode.side_effect = list
+    encoding.decode.side_effect = "".join
+    return encoding
+
 
 class TestEmbeddingServiceStructure:
     """Test EmbeddingService class structure."""
 
     def test_embedding_service_import(self):
         """Test EmbeddingService can be imported."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
         assert EmbeddingService is not None
 
     def test_embedding_result_import(self):
         """Test EmbeddingResult can be imported."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingResult
         assert EmbeddingResult is not None
 
     def test_embedding_constants(self):
         """Test embedding constants are defined."""
-        from src.opportunity_radar.services.embedding_service import (
-            EMBEDDING_MODEL,
-            EMBEDDING_DIMENSION,
-            MAX_BATCH_SIZE,
-            MAX_TOKENS_PER_REQUEST,
-        )
-
         assert EMBEDDING_MODEL == "text-embedding-3-small"
         assert EMBEDDING_DIMENSION == 1536
         assert MAX_BATCH_SIZE == 2048
@@ -33,8 +78,6 @@ class TestEmbeddingServiceStructure:
 
     def test_service_has_required_methods(self):
         """Test EmbeddingService has all required methods."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
         required_methods = [
             "get_embedding",
             "get_embeddings_batch",
@@ -53,28 +96,24 @@ class TestEmbeddingResult:
 
     def test_embedding_result_creation(self):
         """Test EmbeddingResult creation."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingResult
-
         result = EmbeddingResult(
             id="test_id",
-            embedding=[0.1, 0.2, 0.3],
+            embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
             text_length=100,
             success=True,
         )
 
         assert result.id == "test_id"
-        assert result.embedding == [0.1, 0.2, 0.3]
+        assert np.allclose(result.embedding, [0.1, 0.2, 0.3])
         assert result.text_length == 100
         assert result.success is True
         assert result.error is None
 
     def test_embedding_result_with_error(self):
         """Test EmbeddingResult with error."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingResult
-
         result = EmbeddingResult(
             id="test_id",
-            embedding=[],
+            embedding=np.empty(0, dtype=np.float32),
             text_length=0,
             success=False,
             error="API error",
@@ -82,484 +121,581 @@ class TestEmbeddingResult:
 
         assert result.success is False
         assert result.error == "API error"
-        assert result.embedding == []
+        assert result.embedding.size == 0
 
     def test_embedding_result_defaults(self):
         """Test EmbeddingResult default values."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingResult
-
         result = EmbeddingResult(
             id="test_id",
-            embedding=[0.1],
+            embedding=np.array([0.1], dtype=np.float32),
             text_length=10,
         )
 
         assert result.success is True
         assert result.error is None
 
+    def test_embedding_result_to_list(self):
+        """Test EmbeddingResult converts its vector to plain floats."""
+        result = EmbeddingResult(
+            id="test_id",
+            embedding=np.array([0.5, 0.25], dtype=np.float32),
+            text_length=10,
+        )
+
+        assert result.to_list() == [0.5, 0.25]
+        assert all(type(v) is float for v in result.to_list())
+
+    def test_embedding_result_is_immutable(self):
+        """Test EmbeddingResult fields can't be reassigned."""
+        result = EmbeddingResult(
+            id="test_id",
+            embedding=np.array([0.1], dtype=np.float32),
+            text_length=10,
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            result.success = False
+
+    def test_embedding_result_compares_by_identity(self):
+        """Test EmbeddingResult can be compared and hashed despite its array field."""
+        result = EmbeddingResult(
+            id="test_id",
+            embedding=np.array([0.1, 0.2], dtype=np.float32),
+            text_length=10,
+        )
+        twin = EmbeddingResult(id="test_id", embedding=result.embedding.copy(), text_length=10)
+
+        assert result == result
+        assert result != twin
+        assert len({result, twin}) == 2
+
+
+class TestNormalizeRows:
+    """Test the vectorized row normalization helper."""
+
+    def test_normalize_rows_keeps_zero_rows(self):
+        """Test rows are unit length and zero rows don't produce NaN."""
+        result = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]]))
+
+        assert result.dtype == np.float32
+        assert np.allclose(result, [[0.6, 0.8], [0.0, 0.0]])
+
 
 class TestCreateProfileEmbeddingText:
     """Test create_profile_embedding_text method."""
 
-    def test_create_profile_text_basic(self):
+    def test_create_profile_text_basic(self, embedding_service):
         """Test basic profile text creation."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_profile_embedding_text(
-                tech_stack=["Python", "FastAPI"],
-                industries=["AI/ML", "SaaS"],
-                intents=["funding", "networking"],
-            )
+        text = embedding_service.create_profile_embedding_text(
+            tech_stack=["Python", "FastAPI"],
+            industries=["AI/ML", "SaaS"],
+            intents=["funding", "networking"],
+        )
 
-            assert "Python" in text
-            assert "FastAPI" in text
-            assert "AI/ML" in text or "Domain" in text
+        assert "Python" in text
+        assert "FastAPI" in text
+        assert "AI/ML" in text or "Domain" in text
 
-    def test_create_profile_text_with_bio(self):
+    def test_create_profile_text_with_bio(self, embedding_service):
         """Test profile text creation with bio."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_profile_embedding_text(
-                tech_stack=["Python"],
-                industries=["AI"],
-                intents=["learning"],
-                bio="Building AI tools for developers",
-            )
+        text = embedding_service.create_profile_embedding_text(
+            tech_stack=["Python"],
+            industries=["AI"],
+            intents=["learning"],
+            bio="Building AI tools for developers",
+        )
 
-            # Bio should appear first
-            assert text.startswith("Building AI tools")
+        # Bio should appear first
+        assert text.startswith("Building AI tools")
 
-    def test_create_profile_text_with_display_name(self):
+    def test_create_profile_text_with_display_name(self, embedding_service):
         """Test profile text creation with display name."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_profile_embedding_text(
-                tech_stack=["Python"],
-                industries=["AI"],
-                intents=["learning"],
-                display_name="My Cool Project",
-            )
+        text = embedding_service.create_profile_embedding_text(
+            tech_stack=["Python"],
+            industries=["AI"],
+            intents=["learning"],
+            display_name="My Cool Project",
+        )
 
-            assert "My Cool Project" in text
+        assert "My Cool Project" in text
 
-    def test_create_profile_text_empty(self):
+    def test_create_profile_text_empty(self, embedding_service):
         """Test profile text creation with empty inputs."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_profile_embedding_text(
-                tech_stack=[],
-                industries=[],
-                intents=[],
-            )
+        text = embedding_service.create_profile_embedding_text(
+            tech_stack=[],
+            industries=[],
+            intents=[],
+        )
 
-            assert text == "General developer profile"
+        assert text == "General developer profile"
 
 
 class TestExpandTechTerms:
     """Test _expand_tech_terms method."""
 
-    def test_expand_common_abbreviations(self):
+    def test_expand_common_abbreviations(self, embedding_service):
         """Test expansion of common tech abbreviations."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        result = embedding_service._expand_tech_terms(["js", "ts", "py", "ml"])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert "JavaScript" in result
+        assert "TypeScript" in result
+        assert "Python" in result
+        assert "Machine Learning" in result
 
-            result = service._expand_tech_terms(["js", "ts", "py", "ml"])
-
-            assert "JavaScript" in result
-            assert "TypeScript" in result
-            assert "Python" in result
-            assert "Machine Learning" in result
-
-    def test_expand_preserves_unknown(self):
+    def test_expand_preserves_unknown(self, embedding_service):
         """Test expansion preserves unknown terms."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        result = embedding_service._expand_tech_terms(["React", "Vue", "Unknown"])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert "React" in result
+        assert "Vue" in result
+        assert "Unknown" in result
 
-            result = service._expand_tech_terms(["React", "Vue", "Unknown"])
+    def test_expand_normalizes_case_and_whitespace(self, embedding_service):
+        """Test padded or upper-case abbreviations still expand."""
+        result = embedding_service._expand_tech_terms([" JS ", "Py", "LLM"])
 
-            assert "React" in result
-            assert "Vue" in result
-            assert "Unknown" in result
+        assert result == ["JavaScript", "Python", "Large Language Model"]
 
 
 class TestExpandGoals:
     """Test _expand_goals method."""
 
-    def test_expand_known_goals(self):
+    def test_expand_known_goals(self, embedding_service):
         """Test expansion of known goals."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        result = embedding_service._expand_goals(["funding", "networking", "learning"])
 
-            result = service._expand_goals(["funding", "networking", "learning"])
+        assert any("funding" in r.lower() for r in result)
+        assert any("networking" in r.lower() or "collaborator" in r.lower() for r in result)
 
-            assert any("funding" in r.lower() for r in result)
-            assert any("networking" in r.lower() or "collaborator" in r.lower() for r in result)
-
-    def test_expand_preserves_unknown_goals(self):
+    def test_expand_preserves_unknown_goals(self, embedding_service):
         """Test expansion preserves unknown goals."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            result = service._expand_goals(["custom_goal"])
+        result = embedding_service._expand_goals(["custom_goal"])
 
-            assert "custom_goal" in result
+        assert "custom_goal" in result
 
 
 class TestCreateOpportunityEmbeddingText:
     """Test create_opportunity_embedding_text method."""
 
-    def test_create_opportunity_text_basic(self):
+    def test_create_opportunity_text_basic(self, embedding_service):
         """Test basic opportunity text creation."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_opportunity_embedding_text(
-                title="AI Hackathon 2024",
-            )
+        text = embedding_service.create_opportunity_embedding_text(
+            title="AI Hackathon 2024",
+        )
 
-            assert "AI Hackathon 2024" in text
+        assert "AI Hackathon 2024" in text
 
-    def test_create_opportunity_text_with_all_fields(self):
+    def test_create_opportunity_text_with_all_fields(self, embedding_service):
         """Test opportunity text creation with all fields."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
-
-            text = service.create_opportunity_embedding_text(
-                title="AI Hackathon",
-                description="Build AI applications",
-                tags=["AI", "ML"],
-                tech_stack=["Python", "TensorFlow"],
-                industry=["Healthcare", "Finance"],
-                category="hackathon",
-            )
+        text = embedding_service.create_opportunity_embedding_text(
+            title="AI Hackathon",
+            description="Build AI applications",
+            tags=["AI", "ML"],
+            tech_stack=["Python", "TensorFlow"],
+            industry=["Healthcare", "Finance"],
+            category="hackathon",
+        )
 
-            assert "AI Hackathon" in text
-            assert "Build AI applications" in text
-            assert "Python" in text or "Technologies" in text
+        assert "AI Hackathon" in text
+        assert "Build AI applications" in text
+        assert "Python" in text or "Technologies" in text
 
-    def test_create_opportunity_text_truncates_description(self):
+    def test_create_opportunity_text_truncates_description(self, embedding_service):
         """Test opportunity text truncates long description."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        long_description = "A" * 5000
+        text = embedding_service.create_opportunity_embedding_text(
+            title="Test",
+            description=long_description,
+        )
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        # Description should be truncated to 2000 chars
+        assert len(text) < 5000
 
-            long_description = "A" * 5000
-            text = service.create_opportunity_embedding_text(
+    def test_create_opportunity_text_truncates_description_by_tokens(self, embedding_service):
+        """Test the description is cut to DESCRIPTION_MAX_TOKENS tokens."""
+        with patch.object(embedding_module, "_get_encoding", _char_encoding):
+            text = embedding_service.create_opportunity_embedding_text(
                 title="Test",
-                description=long_description,
+                description="A" * 5000,
             )
 
-            # Description should be truncated to 2000 chars
-            assert len(text) < 5000
+        assert text == "Test. " + "A" * embedding_module.DESCRIPTION_MAX_TOKENS
 
 
 class TestGetEmbedding:
     """Test get_embedding method."""
 
-    def test_get_embedding_empty_text_raises(self):
+    def test_get_embedding_empty_text_raises(self, embedding_service):
         """Test get_embedding raises for empty text."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        with pytest.raises(ValueError):
+            embedding_service.get_embedding("")
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+    def test_get_embedding_whitespace_raises(self, embedding_service):
+        """Test get_embedding raises for whitespace-only text."""
+        with pytest.raises(ValueError):
+            embedding_service.get_embedding("   ")
 
-            with pytest.raises(ValueError):
-                service.get_embedding("")
+    def test_get_embedding_success(self, embedding_service):
+        """Test get_embedding returns embedding on success."""
+        embedding_service.client.embeddings.create.return_value = _response([0.1, 0.2, 0.3])
 
-    def test_get_embedding_whitespace_raises(self):
-        """Test get_embedding raises for whitespace-only text."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        result = embedding_service.get_embedding("test text")
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert np.allclose(result, [0.1, 0.2, 0.3])
 
-            with pytest.raises(ValueError):
-                service.get_embedding("   ")
+    def test_get_embedding_truncates_long_text(self, embedding_service):
+        """Test get_embedding truncates text to MAX_TOKENS_PER_REQUEST tokens."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1])
+        encoding = _char_encoding()
 
-    def test_get_embedding_success(self):
-        """Test get_embedding returns embedding on success."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        with patch.object(embedding_module, "_get_encoding", lambda: encoding):
+            embedding_service.get_embedding("A" * 10000)
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
-            mock_client.embeddings.create.return_value = mock_response
+        # Verify the text was truncated
+        called_text = create.call_args[1]["input"]
+        assert len(encoding.encode(called_text)) == MAX_TOKENS_PER_REQUEST
 
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
+    def test_get_embedding_truncates_by_chars_without_tokenizer(self, embedding_service):
+        """Test get_embedding falls back to 8000 chars when tiktoken is unavailable."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1])
 
-            result = service.get_embedding("test text")
+        with patch.object(embedding_module, "_get_encoding", lambda: None):
+            embedding_service.get_embedding("A" * 10000)
 
-            assert result == [0.1, 0.2, 0.3]
+        called_text = create.call_args[1]["input"]
+        assert len(called_text) == 8000
 
-    def test_get_embedding_truncates_long_text(self):
-        """Test get_embedding truncates text longer than 8000 chars."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+    def test_get_embedding_reuses_cached_vector(self, embedding_service):
+        """Test get_embedding does not call the API again for the same text."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1, 0.2])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1])]
-            mock_client.embeddings.create.return_value = mock_response
+        first = embedding_service.get_embedding("same text")
+        second = embedding_service.get_embedding("same text")
 
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
+        assert first == second
+        assert np.allclose(first, [0.1, 0.2])
+        create.assert_called_once()
 
-            long_text = "A" * 10000
-            service.get_embedding(long_text)
+    def test_get_embedding_returns_copies(self, embedding_service):
+        """Test editing a returned embedding doesn't change what later callers get."""
+        embedding_service.client.embeddings.create.return_value = _response([0.5, 0.25])
 
-            # Verify the text was truncated
-            called_text = mock_client.embeddings.create.call_args[1]["input"]
-            assert len(called_text) == 8000
+        first = embedding_service.get_embedding("same text")
+        first[0] = 9.0
+        second = embedding_service.get_embedding("same text")
+        second.append(1.0)
+
+        assert embedding_service.get_embedding("same text") == [0.5, 0.25]
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache LRU behaviour."""
+
+    def test_cache_miss_returns_none(self):
+        """Test unknown keys return None."""
+        cache = EmbeddingCache()
+
+        assert cache.get(cache.key("missing")) is None
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        cache = EmbeddingCache(maxsize=2)
+        cache.put("a", (0.1,))
+        cache.put("b", (0.2,))
+        cache.get("a")
+        cache.put("c", (0.3,))
+
+        assert len(cache) == 2
+        assert cache.get("a") == (0.1,)
+        assert cache.get("b") is None
 
 
 class TestGetEmbeddingsBatch:
     """Test get_embeddings_batch method."""
 
-    def test_batch_empty_list(self):
+    def test_batch_empty_list(self, embedding_service):
         """Test batch embedding with empty list."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        result = embedding_service.get_embeddings_batch([])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert len(result) == 0
+
+    def test_batch_filters_empty_texts(self, embedding_service):
+        """Test batch embedding filters empty texts."""
+        result = embedding_service.get_embeddings_batch(["", "  ", None])
 
-            result = service.get_embeddings_batch([])
+        # All texts filtered out
+        assert len(result) == 0
 
-            assert result == []
+    def test_batch_preserves_order(self, embedding_service):
+        """Test batch embedding preserves order."""
+        embedding_service.client.embeddings.create.return_value = _response([0.1], [0.2], [0.3])
 
-    def test_batch_filters_empty_texts(self):
-        """Test batch embedding filters empty texts."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        result = embedding_service.get_embeddings_batch(["text1", "text2", "text3"])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert result.dtype == np.float32
+        assert np.allclose(result, [[0.1], [0.2], [0.3]])
 
-            result = service.get_embeddings_batch(["", "  ", None])
+    def test_batch_embeds_duplicate_texts_once(self, embedding_service):
+        """Test repeated texts are sent once and broadcast back in order."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1], [0.2])
 
-            # All texts filtered out
-            assert result == []
+        result = embedding_service.get_embeddings_batch(["a", "b", "a"])
 
-    def test_batch_preserves_order(self):
-        """Test batch embedding preserves order."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        assert create.call_args[1]["input"] == ["a", "b"]
+        assert np.allclose(result, [[0.1], [0.2], [0.1]])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
+    def test_batch_splits_into_sub_batches(self, embedding_service):
+        """Test inputs over MAX_BATCH_SIZE are sent as several ordered requests."""
+        create = embedding_service.client.embeddings.create
+        create.side_effect = _echo_create
+
+        with patch.object(embedding_module, "MAX_BATCH_SIZE", 2):
+            result = embedding_service.get_embeddings_batch([f"text{i}" for i in range(5)])
+
+        assert create.call_count == 3
+        assert np.allclose(result, [[0.0], [1.0], [2.0], [3.0], [4.0]])
+
+    def test_batch_splits_rejected_request(self, embedding_service):
+        """Test a request rejected as too large is retried in halves."""
+
+        def fake_create(input, **kwargs):
+            if len(input) > 2:
+                raise _api_error(BadRequestError, "too many tokens", 400)
+            return _echo_create(input)
 
-            # Create mock response with indexed data
-            mock_data = [
-                MagicMock(index=0, embedding=[0.1]),
-                MagicMock(index=1, embedding=[0.2]),
-                MagicMock(index=2, embedding=[0.3]),
-            ]
-            mock_response = MagicMock()
-            mock_response.data = mock_data
-            mock_client.embeddings.create.return_value = mock_response
+        create = embedding_service.client.embeddings.create
+        create.side_effect = fake_create
 
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
+        result = embedding_service.get_embeddings_batch([f"text{i}" for i in range(4)])
 
-            result = service.get_embeddings_batch(["text1", "text2", "text3"])
+        assert create.call_count == 3
+        assert np.allclose(result, [[0.0], [1.0], [2.0], [3.0]])
 
-            assert result == [[0.1], [0.2], [0.3]]
+
+class TestPackChunks:
+    """Test _pack_chunks request packing."""
+
+    def test_pack_respects_token_budget(self):
+        """Test chunks are closed before exceeding MAX_TOKENS_PER_BATCH."""
+        with patch.object(
+            embedding_module, "_token_counts", lambda texts: [4] * len(texts)
+        ), patch.object(embedding_module, "MAX_TOKENS_PER_BATCH", 10):
+            chunks = list(embedding_module._pack_chunks(["a", "b", "c", "d", "e"]))
+
+        assert chunks == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_pack_keeps_oversized_text_alone(self):
+        """Test a text over the budget still gets its own chunk."""
+        with patch.object(embedding_module, "_token_counts", lambda texts: [20, 1]), patch.object(
+            embedding_module, "MAX_TOKENS_PER_BATCH", 10
+        ):
+            chunks = list(embedding_module._pack_chunks(["big", "small"]))
+
+        assert chunks == [["big"], ["small"]]
+
+    def test_token_counts_fallback_uses_utf8_bytes(self):
+        """Test the no-tokenizer estimate never undercounts multi-byte text."""
+        with patch.object(embedding_module, "_get_encoding", lambda: None):
+            counts = embedding_module._token_counts(["abc", "机器学习", "🚀"])
+
+        assert counts == [3, 12, 4]
 
 
 class TestGenerateOpportunityEmbedding:
     """Test generate_opportunity_embedding method."""
 
-    def test_generate_opportunity_embedding_success(self):
+    def test_generate_opportunity_embedding_success(self, embedding_service):
         """Test successful opportunity embedding generation."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        embedding_service.client.embeddings.create.return_value = _response([0.1, 0.2])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
-            mock_client.embeddings.create.return_value = mock_response
-
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
-
-            result = service.generate_opportunity_embedding(
-                opportunity_id="opp123",
-                title="AI Hackathon",
-                description="Build AI apps",
-            )
+        result = embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp123",
+            title="AI Hackathon",
+            description="Build AI apps",
+        )
 
-            assert result.success is True
-            assert result.id == "opp123"
-            assert result.embedding == [0.1, 0.2]
-            assert result.text_length > 0
+        assert result.success is True
+        assert result.id == "opp123"
+        assert np.allclose(result.embedding, [0.1, 0.2])
+        assert result.text_length > 0
 
-    def test_generate_opportunity_embedding_error(self):
+    def test_generate_opportunity_embedding_error(self, embedding_service):
         """Test opportunity embedding generation handles errors."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        embedding_service.client.embeddings.create.side_effect = Exception("API error")
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
-            mock_client.embeddings.create.side_effect = Exception("API error")
+        result = embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp123",
+            title="Test",
+        )
+
+        assert result.success is False
+        assert result.error is not None
+        assert result.embedding.size == 0
+
+    def test_generate_opportunity_embedding_reuses_near_duplicate(self, embedding_service):
+        """Test a one-character title edit reuses the cached embedding."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1, 0.2])
+
+        description = (
+            "Build AI applications that help clinicians triage patients faster. "
+            "Teams of up to four people compete over a weekend for cash prizes, "
+            "cloud credits and mentorship from industry experts."
+        )
+        first = embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp123", title="AI Hackathon", description=description
+        )
+        second = embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp123", title="AI Hackathn", description=description
+        )
 
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
+        assert np.array_equal(second.embedding, first.embedding)
+        create.assert_called_once()
 
-            result = service.generate_opportunity_embedding(
-                opportunity_id="opp123",
-                title="Test",
+    def test_generate_opportunity_embedding_embeds_different_text(self, embedding_service):
+        """Test unrelated opportunities are each embedded."""
+        create = embedding_service.client.embeddings.create
+        create.return_value = _response([0.1, 0.2])
+
+        embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp1",
+            title="AI Hackathon",
+            description="Build AI applications that help clinicians triage patients faster.",
+        )
+        embedding_service.generate_opportunity_embedding(
+            opportunity_id="opp2",
+            title="Climate Grant",
+            description="Funding for soil carbon research at small farms across Europe.",
+        )
+
+        assert create.call_count == 2
+
+    def test_generate_opportunity_embedding_templated_opportunities(self, embedding_service):
+        """Test opportunities sharing a templated description still get their own embedding."""
+        create = embedding_service.client.embeddings.create
+        create.side_effect = [_response([0.1, 0.2]), _response([0.3, 0.4])]
+
+        description = (
+            "Build AI applications that help clinicians triage patients faster. "
+            "Teams of up to four people compete over a weekend for cash prizes, "
+            "cloud credits and mentorship from industry experts."
+        )
+        texts = [
+            embedding_service.create_opportunity_embedding_text(
+                title=title, description=description, category="hackathon"
+            )
+            for title in ("Climate Hack", "Health Hack")
+        ]
+        # Close enough to count as near-duplicates of each other
+        distance = (
+            embedding_module._simhash(texts[0]) ^ embedding_module._simhash(texts[1])
+        ).bit_count()
+        assert distance <= embedding_module.SIMHASH_MAX_DISTANCE
+
+        climate, health = (
+            embedding_service.generate_opportunity_embedding(
+                opportunity_id=opp_id, title=title, description=description, category="hackathon"
             )
+            for opp_id, title in (("opp1", "Climate Hack"), ("opp2", "Health Hack"))
+        )
 
-            assert result.success is False
-            assert result.error is not None
-            assert result.embedding == []
+        assert create.call_count == 2
+        assert not np.array_equal(climate.embedding, health.embedding)
 
 
 class TestGenerateOpportunityEmbeddingsBatch:
     """Test generate_opportunity_embeddings_batch method."""
 
-    def test_batch_empty_list(self):
+    def test_batch_empty_list(self, embedding_service):
         """Test batch with empty opportunity list."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
-
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        results, stats = embedding_service.generate_opportunity_embeddings_batch([])
 
-            results, stats = service.generate_opportunity_embeddings_batch([])
+        assert results == []
+        assert stats["total"] == 0
 
-            assert results == []
-            assert stats["total"] == 0
-
-    def test_batch_skips_missing_id(self):
+    def test_batch_skips_missing_id(self, embedding_service):
         """Test batch skips opportunities without ID."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        opportunities = [{"title": "No ID"}]
+        results, stats = embedding_service.generate_opportunity_embeddings_batch(opportunities)
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        assert stats["skipped"] == 1
 
-            opportunities = [{"title": "No ID"}]
-            results, stats = service.generate_opportunity_embeddings_batch(opportunities)
+    def test_batch_skips_missing_title(self, embedding_service):
+        """Test batch skips opportunities without title."""
+        opportunities = [{"id": "123"}]
+        results, stats = embedding_service.generate_opportunity_embeddings_batch(opportunities)
 
-            assert stats["skipped"] == 1
+        assert len(results) == 1
+        assert results[0].success is False
 
-    def test_batch_skips_missing_title(self):
-        """Test batch skips opportunities without title."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+    def test_batch_success(self, embedding_service):
+        """Test successful batch embedding generation."""
+        embedding_service.client.embeddings.create.return_value = _response([0.1], [0.2])
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            service.client = MagicMock()
-            service.model = "text-embedding-3-small"
+        opportunities = [
+            {"id": "1", "title": "Hackathon 1"},
+            {"id": "2", "title": "Hackathon 2"},
+        ]
+        results, stats = embedding_service.generate_opportunity_embeddings_batch(opportunities)
 
-            opportunities = [{"id": "123"}]
-            results, stats = service.generate_opportunity_embeddings_batch(opportunities)
+        assert stats["success"] == 2
+        assert len(results) == 2
 
-            assert len(results) == 1
-            assert results[0].success is False
+    def test_batch_isolates_failing_opportunity(self, embedding_service):
+        """Test one rejected text doesn't fail the rest of its batch."""
 
-    def test_batch_success(self):
-        """Test successful batch embedding generation."""
-        from src.opportunity_radar.services.embedding_service import EmbeddingService
+        def fake_create(input, **kwargs):
+            if any("Broken" in text for text in input):
+                raise _api_error(BadRequestError, "invalid input", 400)
+            return _response(*([0.5] for _ in input))
 
-        with patch.object(EmbeddingService, "__init__", lambda self: None):
-            service = EmbeddingService()
-            mock_client = MagicMock()
+        create = embedding_service.client.embeddings.create
+        create.side_effect = fake_create
+
+        opportunities = [
+            {"id": "1", "title": "Hackathon 1"},
+            {"id": "2", "title": "Broken"},
+            {"id": "3", "title": "Hackathon 3"},
+        ]
+        results, stats = embedding_service.generate_opportunity_embeddings_batch(opportunities)
 
-            mock_data = [
-                MagicMock(index=0, embedding=[0.1]),
-                MagicMock(index=1, embedding=[0.2]),
-            ]
-            mock_response = MagicMock()
-            mock_response.data = mock_data
-            mock_client.embeddings.create.return_value = mock_response
+        assert stats["success"] == 2
+        assert stats["failed"] == 1
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "invalid input"
+        # [1, 2, 3] -> [1] ok, [2, 3] -> [2] rejected, [3] ok; no half is sent twice
+        assert create.call_count == 5
 
-            service.client = mock_client
-            service.model = "text-embedding-3-small"
+    def test_batch_does_not_split_on_rate_limit(self, embedding_service):
+        """Test a rate-limited batch fails as a whole without retrying in halves."""
+        create = embedding_service.client.embeddings.create
+        create.side_effect = _api_error(RateLimitError, "rate limited", 429)
 
-            opportunities = [
-                {"id": "1", "title": "Hackathon 1"},
-                {"id": "2", "title": "Hackathon 2"},
-            ]
-            results, stats = service.generate_opportunity_embeddings_batch(opportunities)
+        opportunities = [{"id": str(i), "title": f"Hackathon {i}"} for i in range(4)]
+        results, stats = embedding_service.generate_opportunity_embeddings_batch(opportunities)
 
-            assert stats["success"] == 2
-            assert len(results) == 2
+        assert create.call_count == 1
+        assert stats["failed"] == 4
+        assert all(r.error == "rate limited" for r in results)
 
 
 class TestSingleton:
     """Test singleton instance."""
 
+    @pytest.fixture(autouse=True)
+    def reset_singleton(self):
+        """Clear the cached singleton before and after, so no test sees another's instance."""
+        get_embedding_service.cache_clear()
+        yield
+        get_embedding_service.cache_clear()
+
     def test_get_embedding_service(self):
         """Test get_embedding_service returns singleton."""
-        from src.opportunity_radar.services.embedding_service import get_embedding_service
-
-        # Reset singleton for test
-        import src.opportunity_radar.services.embedding_service as module
-        module._embedding_service = None
-
-        with patch.object(module.EmbeddingService, "__init__", lambda self: None):
+        with patch.object(EmbeddingService, "__init__", lambda self: None):
             service1 = get_embedding_service()
             service2 = get_embedding_service()
 
@@ -184,3 +184,62 @@ class TestEnrichMatchWithOpportunity:
 
         assert "opportunity_description" not in result
         assert "opportunity_prize_pool" not in result
+
+    def test_enrich_result_is_json_serializable(self):
+        """Test enriched matches can be sent as a JSONResponse without encoding."""
+        import json
+        from datetime import datetime
+        from unittest.mock import MagicMock
+        from beanie import PydanticObjectId
+        from src.opportunity_radar.api.v1.endpoints.helpers import (
+            enrich_match_with_opportunity,
+        )
+        from src.opportunity_radar.models.match import Match
+
+        match = Match.model_construct(
+            user_id=PydanticObjectId(),
+            opportunity_id=PydanticObjectId(),
+            overall_score=0.7,
+        )
+        mock_opp = MagicMock()
+        mock_opp.title = "Test"
+        mock_opp.opportunity_type = "hackathon"
+        mock_opp.description = "Description"
+        mock_opp.application_deadline = datetime(2025, 1, 1)
+        mock_opp.website_url = "https://example.com"
+        mock_opp.total_prize_value = 10000.0
+
+        result = enrich_match_with_opportunity(
+            match, mock_opp, include_description=True, include_prize_pool=True
+        )
+
+        assert json.loads(json.dumps(result))["deadline"] == "2025-01-01T00:00:00"
+
+
+class TestEnrichMatchesWithOpportunities:
+    """Test enrich_matches_with_opportunities bulk enrichment."""
+
+    async def test_fetches_opportunities_once(self):
+        """Test opportunities are fetched in a single bulk query."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from src.opportunity_radar.api.v1.endpoints import helpers
+
+        matches = []
+        for opp_id in ("opp1", "opp2", "opp1", None):
+            match = MagicMock()
+            match.model_dump.return_value = {}
+            match.overall_score = 0.5
+            match.opportunity_id = opp_id
+            matches.append(match)
+
+        opp = MagicMock()
+        opp.application_deadline = None
+        fetch = AsyncMock(return_value={"opp1": opp})
+
+        with patch.object(helpers, "fetch_opportunities_by_ids", fetch):
+            result = await helpers.enrich_matches_with_opportunities(matches)
+
+        fetch.assert_awaited_once_with(["opp1", "opp2"])
+        assert len(result) == 4
+        assert result[0]["opportunity_title"] is opp.title
+        assert result[1]["opportunity_title"] is None
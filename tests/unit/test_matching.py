@@ -2,31 +2,25 @@
 
 import pytest
 
+from src.opportunity_radar.matching import DSLEngine, MatchingScorer
+from src.opportunity_radar.matching.dsl_engine import OpportunityContext, ProfileContext
+from src.opportunity_radar.matching.scorer import ScoreBreakdown
+
 
 class TestDSLEngine:
     """Test DSL Engine functionality."""
 
     def test_import_dsl_engine(self):
         """Test DSLEngine import."""
-        from src.opportunity_radar.matching import DSLEngine
-
         assert DSLEngine is not None
 
     def test_dsl_engine_initialization(self):
         """Test DSLEngine can be initialized."""
-        from src.opportunity_radar.matching.dsl_engine import DSLEngine
-
         engine = DSLEngine()
         assert engine is not None
 
     def test_eligible_profile_evaluation(self):
         """Test evaluation of eligible profile."""
-        from src.opportunity_radar.matching.dsl_engine import (
-            DSLEngine,
-            OpportunityContext,
-            ProfileContext,
-        )
-
         engine = DSLEngine()
 
         profile = ProfileContext(
@@ -53,12 +47,6 @@ class TestDSLEngine:
 
     def test_student_only_rejection(self):
         """Test non-student rejected from student-only opportunity."""
-        from src.opportunity_radar.matching.dsl_engine import (
-            DSLEngine,
-            OpportunityContext,
-            ProfileContext,
-        )
-
         engine = DSLEngine()
 
         profile = ProfileContext(
@@ -79,12 +67,6 @@ class TestDSLEngine:
 
     def test_region_mismatch(self):
         """Test region mismatch detection."""
-        from src.opportunity_radar.matching.dsl_engine import (
-            DSLEngine,
-            OpportunityContext,
-            ProfileContext,
-        )
-
         engine = DSLEngine()
 
         profile = ProfileContext(
@@ -108,21 +90,15 @@ class TestMatchingScorer:
 
     def test_import_matching_scorer(self):
         """Test MatchingScorer import."""
-        from src.opportunity_radar.matching import MatchingScorer
-
         assert MatchingScorer is not None
 
     def test_scorer_initialization(self):
         """Test MatchingScorer initialization with DSL Engine."""
-        from src.opportunity_radar.matching.scorer import MatchingScorer
-
         scorer = MatchingScorer()
         assert scorer.dsl_engine is not None
 
     def test_score_breakdown_calculation(self):
         """Test ScoreBreakdown computation."""
-        from src.opportunity_radar.matching.scorer import ScoreBreakdown
-
         breakdown = ScoreBreakdown(
             semantic_score=0.8,
             eligibility_score=1.0,
@@ -136,8 +112,6 @@ class TestMatchingScorer:
 
     def test_score_breakdown_all_zeros(self):
         """Test ScoreBreakdown with all zeros."""
-        from src.opportunity_radar.matching.scorer import ScoreBreakdown
-
         breakdown = ScoreBreakdown(
             semantic_score=0.0,
             eligibility_score=0.0,
@@ -150,8 +124,6 @@ class TestMatchingScorer:
 
     def test_score_breakdown_all_ones(self):
         """Test ScoreBreakdown with all ones."""
-        from src.opportunity_radar.matching.scorer import ScoreBreakdown
-
         breakdown = ScoreBreakdown(
             semantic_score=1.0,
             eligibility_score=1.0,
@@ -1,23 +1,74 @@
 """Comprehensive unit tests for MongoMatchingService."""
 
+import math
+import random
+from datetime import datetime, timedelta
+
 import pytest
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from dataclasses import dataclass
-
 
+from src.opportunity_radar.services.mongo_matching_service import (
+    INDUSTRY_ALIASES,
+    MatchBatch,
+    MatchExplanation,
+    MatchResult,
+    MatchScoreBreakdown,
+    MongoMatchingService,
+    _fuzzy_industry_match,
+    _team_size_query,
+    fuzzy_industry_match,
+    get_mongo_matching_service,
+)
+
+
+def _profile(**attrs):
+    """Build a Profile stand-in with the attributes the matching service reads."""
+    defaults = {
+        "team_size": None,
+        "funding_stage": None,
+        "embedding": None,
+        "interests": [],
+        "tech_stack": [],
+    }
+    return SimpleNamespace(**{**defaults, **attrs})
+
+
+def _opportunity(**attrs):
+    """Build an Opportunity stand-in with the attributes the matching service reads."""
+    defaults = {
+        "id": None,
+        "team_size_min": None,
+        "team_size_max": None,
+        "opportunity_type": "hackathon",
+        "embedding": None,
+        "created_at": None,
+        "participant_count": None,
+        "themes": [],
+        "technologies": [],
+    }
+    return SimpleNamespace(**{**defaults, **attrs})
+
+
+@pytest.fixture
+def match_model(monkeypatch):
+    """Replace the Match document class used by the service with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.opportunity_radar.services.mongo_matching_service.Match", mock)
+    return mock
+
+
+@pytest.mark.xdist_group(name="matching_structure")
 class TestMatchScoreBreakdown:
     """Test MatchScoreBreakdown dataclass."""
 
     def test_match_score_breakdown_import(self):
         """Test MatchScoreBreakdown can be imported."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
         assert MatchScoreBreakdown is not None
 
     def test_match_score_breakdown_defaults(self):
         """Test MatchScoreBreakdown default values."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
         breakdown = MatchScoreBreakdown()
 
         assert breakdown.semantic_score == 0.0
@@ -27,88 +78,45 @@ class TestMatchScoreBreakdown:
         assert breakdown.funding_stage_eligible is True
         assert breakdown.location_eligible is True
 
-    def test_is_eligible_all_true(self):
-        """Test is_eligible when all criteria met."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(
-            team_size_eligible=True,
-            funding_stage_eligible=True,
-            location_eligible=True,
-        )
-
-        assert breakdown.is_eligible is True
-
-    def test_is_eligible_team_size_false(self):
-        """Test is_eligible when team size fails."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(team_size_eligible=False)
-
-        assert breakdown.is_eligible is False
-
-    def test_is_eligible_funding_stage_false(self):
-        """Test is_eligible when funding stage fails."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(funding_stage_eligible=False)
-
-        assert breakdown.is_eligible is False
-
-    def test_total_score_when_ineligible(self):
-        """Test total_score returns 0 when ineligible."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(
-            semantic_score=0.9,
-            team_size_eligible=False,
-        )
-
-        assert breakdown.total_score == 0.0
-
-    def test_total_score_calculation(self):
-        """Test total_score calculation with boosts."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(
-            semantic_score=0.8,
-            recency_boost=0.02,
-            popularity_boost=0.01,
-        )
-
-        # Boost is capped at 0.05
-        expected = 0.8 + 0.03
-        assert breakdown.total_score == pytest.approx(expected, rel=1e-3)
-
-    def test_total_score_boost_cap(self):
-        """Test total_score boost is capped at 0.05."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(
-            semantic_score=0.8,
-            recency_boost=0.1,  # Would exceed cap
-            popularity_boost=0.1,
-        )
-
-        # Boost should be capped at 0.05
-        expected = 0.8 + 0.05
-        assert breakdown.total_score == pytest.approx(expected, rel=1e-3)
-
-    def test_total_score_max_cap(self):
-        """Test total_score is capped at 1.0."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
-        breakdown = MatchScoreBreakdown(
-            semantic_score=0.98,
-            recency_boost=0.05,
-        )
-
-        assert breakdown.total_score == 1.0
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {
+                    "team_size_eligible": True,
+                    "funding_stage_eligible": True,
+                    "location_eligible": True,
+                },
+                True,
+            ),
+            ({"team_size_eligible": False}, False),
+            ({"funding_stage_eligible": False}, False),
+        ],
+        ids=["all-true", "team-size-false", "funding-stage-false"],
+    )
+    def test_is_eligible(self, kwargs, expected):
+        """Test is_eligible requires every hard filter to pass."""
+        assert MatchScoreBreakdown(**kwargs).is_eligible is expected
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            # Ineligible matches score 0 regardless of similarity
+            ({"semantic_score": 0.9, "team_size_eligible": False}, 0.0),
+            ({"semantic_score": 0.8, "recency_boost": 0.02, "popularity_boost": 0.01}, 0.8 + 0.03),
+            # Boost is capped at 0.05
+            ({"semantic_score": 0.8, "recency_boost": 0.1, "popularity_boost": 0.1}, 0.8 + 0.05),
+            # Total is capped at 1.0
+            ({"semantic_score": 0.98, "recency_boost": 0.05}, 1.0),
+        ],
+        ids=["ineligible", "with-boosts", "boost-cap", "max-cap"],
+    )
+    def test_total_score(self, kwargs, expected):
+        """Test total_score combines semantic score and capped boosts."""
+        assert math.isclose(MatchScoreBreakdown(**kwargs).total_score, expected, rel_tol=1e-3)
 
     def test_to_dict(self):
         """Test to_dict conversion."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchScoreBreakdown
-
         breakdown = MatchScoreBreakdown(
             semantic_score=0.75,
             recency_boost=0.02,
@@ -123,18 +131,44 @@ class TestMatchScoreBreakdown:
         assert result["semantic_score"] == 0.75
 
 
+@pytest.mark.xdist_group(name="matching_structure")
+class TestMatchBatch:
+    """Test MatchBatch vectorized scoring."""
+
+    def test_match_batch_total_scores_matches_scalar(self):
+        """Test vectorized total scores equal per-row MatchScoreBreakdown.total_score."""
+        rng = np.random.default_rng(42)
+        count = 500
+        batch = MatchBatch(
+            semantic=rng.uniform(0.0, 1.0, count),
+            recency=rng.choice([0.0, 0.01, 0.02, 0.04], count),
+            popularity=rng.choice([0.0, 0.01, 0.03], count),
+            eligible=rng.random(count) > 0.2,
+        )
+
+        expected = [
+            MatchScoreBreakdown(
+                semantic_score=float(batch.semantic[i]),
+                recency_boost=float(batch.recency[i]),
+                popularity_boost=float(batch.popularity[i]),
+                team_size_eligible=bool(batch.eligible[i]),
+            ).total_score
+            for i in range(count)
+        ]
+
+        np.testing.assert_array_equal(batch.total_scores(), expected)
+
+
+@pytest.mark.xdist_group(name="matching_structure")
 class TestMatchExplanation:
     """Test MatchExplanation dataclass."""
 
     def test_match_explanation_import(self):
         """Test MatchExplanation can be imported."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchExplanation
         assert MatchExplanation is not None
 
     def test_match_explanation_creation(self):
         """Test MatchExplanation creation."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchExplanation
-
         explanation = MatchExplanation(
             primary_reason="Great match for your skills",
             matching_skills=["Python", "FastAPI"],
@@ -147,8 +181,6 @@ class TestMatchExplanation:
 
     def test_match_explanation_to_dict(self):
         """Test MatchExplanation to_dict."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchExplanation
-
         explanation = MatchExplanation(
             primary_reason="Good match",
             matching_skills=["Python"],
@@ -162,22 +194,16 @@ class TestMatchExplanation:
         assert result["warnings"] == ["Deadline soon"]
 
 
+@pytest.mark.xdist_group(name="matching_structure")
 class TestMatchResult:
     """Test MatchResult dataclass."""
 
     def test_match_result_import(self):
         """Test MatchResult can be imported."""
-        from src.opportunity_radar.services.mongo_matching_service import MatchResult
         assert MatchResult is not None
 
     def test_match_result_creation(self):
         """Test MatchResult creation."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MatchResult,
-            MatchScoreBreakdown,
-            MatchExplanation,
-        )
-
         breakdown = MatchScoreBreakdown(semantic_score=0.8)
         explanation = MatchExplanation(primary_reason="Good match")
 
@@ -191,27 +217,37 @@ class TestMatchResult:
         assert result.opportunity_id == "507f1f77bcf86cd799439011"
         assert result.score == 0.8
 
+    def test_match_dataclasses_use_slots(self):
+        """Test per-opportunity result objects carry no instance __dict__."""
+        breakdown = MatchScoreBreakdown()
+        explanation = MatchExplanation(primary_reason="Good match")
+        result = MatchResult(
+            opportunity_id="507f1f77bcf86cd799439011",
+            score=0.0,
+            breakdown=breakdown,
+            explanation=explanation,
+        )
 
+        for obj in (breakdown, explanation, result):
+            assert not hasattr(obj, "__dict__")
+
+
+@pytest.mark.xdist_group(name="matching_structure")
 class TestFuzzyIndustryMatch:
     """Test fuzzy_industry_match function."""
 
     def test_fuzzy_industry_match_import(self):
         """Test fuzzy_industry_match can be imported."""
-        from src.opportunity_radar.services.mongo_matching_service import fuzzy_industry_match
         assert fuzzy_industry_match is not None
 
     def test_fuzzy_match_empty_sets(self):
         """Test fuzzy match with empty sets."""
-        from src.opportunity_radar.services.mongo_matching_service import fuzzy_industry_match
-
         score, matches = fuzzy_industry_match(set(), set())
         assert score == 0.5
         assert matches == []
 
     def test_fuzzy_match_direct_overlap(self):
         """Test fuzzy match with direct overlap."""
-        from src.opportunity_radar.services.mongo_matching_service import fuzzy_industry_match
-
         profile_industries = {"ai", "fintech"}
         opp_themes = {"ai", "healthcare"}
 
@@ -222,8 +258,6 @@ class TestFuzzyIndustryMatch:
 
     def test_fuzzy_match_alias_matching(self):
         """Test fuzzy match with alias matching."""
-        from src.opportunity_radar.services.mongo_matching_service import fuzzy_industry_match
-
         profile_industries = {"machine learning"}
         opp_themes = {"ai/ml"}
 
@@ -234,8 +268,6 @@ class TestFuzzyIndustryMatch:
 
     def test_fuzzy_match_substring_matching(self):
         """Test fuzzy match with substring matching."""
-        from src.opportunity_radar.services.mongo_matching_service import fuzzy_industry_match
-
         profile_industries = {"web"}
         opp_themes = {"web development"}
 
@@ -244,26 +276,46 @@ class TestFuzzyIndustryMatch:
         assert score > 0
         assert len(matches) > 0
 
+    def test_fuzzy_match_keeps_original_theme_case(self):
+        """Test matching is case-insensitive but returns themes as given."""
+        score, matches = fuzzy_industry_match({"Web"}, {"Web Development", "Gaming"})
+
+        assert score > 0
+        assert matches == ["Web Development"]
+
+    def test_fuzzy_industry_match_cached(self):
+        """Test repeated theme sets are served from the cache."""
+        _fuzzy_industry_match.cache_clear()
+
+        for _ in range(1000):
+            score, matches = fuzzy_industry_match(
+                {"ai", "fintech"}, {"machine learning", "payments"}
+            )
 
+        assert _fuzzy_industry_match.cache_info().hits == 999
+        assert score == 1.0
+        assert sorted(matches) == ["machine learning", "payments"]
+        # Callers get their own list, not the cached tuple
+        matches.append("mutated")
+        again = fuzzy_industry_match({"ai", "fintech"}, {"machine learning", "payments"})
+        assert "mutated" not in again[1]
+
+
+@pytest.mark.xdist_group(name="matching_structure")
 class TestMongoMatchingServiceStructure:
     """Test MongoMatchingService class structure."""
 
     def test_service_import(self):
         """Test MongoMatchingService can be imported."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
         assert MongoMatchingService is not None
 
     def test_service_instantiation(self):
         """Test MongoMatchingService can be instantiated."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
         service = MongoMatchingService()
         assert service is not None
 
     def test_service_has_required_methods(self):
         """Test MongoMatchingService has all required methods."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
         required_methods = [
             "compute_matches_for_profile",
             "save_matches",
@@ -278,217 +330,187 @@ class TestMongoMatchingServiceStructure:
 
     def test_embedding_service_lazy_load(self):
         """Test embedding service is lazy loaded."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
         service = MongoMatchingService()
         assert service._embedding_service is None
 
 
+@pytest.mark.xdist_group(name="matching_service")
 class TestCosineSimilarity:
     """Test cosine similarity calculation."""
 
-    def test_cosine_similarity_identical_vectors(self):
-        """Test cosine similarity of identical vectors."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-        vec = [1.0, 0.0, 0.0]
-
-        similarity = service._cosine_similarity(vec, vec)
-
-        # Identical vectors should have high similarity (after transformation)
-        assert similarity > 0.5
-
-    def test_cosine_similarity_orthogonal_vectors(self):
-        """Test cosine similarity of orthogonal vectors."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [0.0, 1.0, 0.0]
-
-        similarity = service._cosine_similarity(vec1, vec2)
-
-        # Orthogonal vectors have 0 raw similarity, transformed to low score
-        assert similarity < 0.5
-
-    def test_cosine_similarity_opposite_vectors(self):
-        """Test cosine similarity of opposite vectors."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [-1.0, 0.0, 0.0]
-
-        similarity = service._cosine_similarity(vec1, vec2)
-
-        # Opposite vectors should have very low similarity
-        assert similarity < 0.3
-
-    def test_cosine_similarity_zero_vector(self):
-        """Test cosine similarity with zero vector."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [0.0, 0.0, 0.0]
-
-        similarity = service._cosine_similarity(vec1, vec2)
-
-        # Zero vector should result in 0 similarity
-        assert similarity == 0.0
-
-    def test_cosine_similarity_realistic_embeddings(self):
+    @pytest.mark.parametrize(
+        "vec1,vec2,predicate",
+        [
+            # Identical vectors should have high similarity (after transformation)
+            ([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], lambda sim: sim > 0.5),
+            # Orthogonal vectors have 0 raw similarity, transformed to low score
+            ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], lambda sim: sim < 0.5),
+            # Opposite vectors should have very low similarity
+            ([1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], lambda sim: sim < 0.3),
+            # Zero vector should result in 0 similarity
+            ([1.0, 0.0, 0.0], [0.0, 0.0, 0.0], lambda sim: sim == 0.0),
+        ],
+        ids=["identical", "orthogonal", "opposite", "zero-vector"],
+    )
+    def test_cosine_similarity(self, matching_service, vec1, vec2, predicate):
+        """Test cosine similarity of simple vector pairs."""
+        assert predicate(matching_service._cosine_similarity(vec1, vec2))
+
+    def test_cosine_similarity_realistic_embeddings(self, matching_service):
         """Test cosine similarity with realistic embedding-like vectors."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-
         # Generate random normalized vectors (like real embeddings)
         np.random.seed(42)
-        vec1 = np.random.randn(1536).tolist()
-        vec2 = np.random.randn(1536).tolist()
+        query = np.random.randn(1536).astype(np.float32)
+        matrix = np.random.randn(100, 1536).astype(np.float32)
+
+        similarities = matching_service._cosine_similarity_batch(query, matrix)
+
+        # One score per row, all in valid range
+        assert similarities.shape == (100,)
+        assert np.all((similarities >= 0.0) & (similarities <= 1.0))
+        # The per-pair path takes the same ndarrays without conversion
+        assert similarities[0] == pytest.approx(
+            matching_service._cosine_similarity(query, matrix[0]), abs=1e-6
+        )
+
+    def test_cosine_similarity_batch_matches_scalar(self, matching_service):
+        """Test batched cosine similarity agrees with the per-pair path."""
+        query = [1.0, 0.0, 0.0]
+        matrix = np.array([
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [-1.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [0.4, 0.9, 0.1],
+        ])
 
-        similarity = service._cosine_similarity(vec1, vec2)
+        similarities = matching_service._cosine_similarity_batch(query, matrix)
 
-        # Should be in valid range
-        assert 0.0 <= similarity <= 1.0
+        expected = [matching_service._cosine_similarity(query, row.tolist()) for row in matrix]
+        assert isinstance(similarities, np.ndarray)
+        np.testing.assert_allclose(similarities, expected, atol=1e-6)
 
 
+@pytest.mark.xdist_group(name="matching_service")
 class TestHardFilters:
     """Test hard eligibility filters."""
 
-    def test_apply_hard_filters_team_size_too_small(self):
+    def test_apply_hard_filters_team_size_too_small(self, matching_service):
         """Test team size filter when team is too small."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown()
         eligibility_issues = []
 
-        # Mock profile with team_size=1
-        mock_profile = MagicMock()
-        mock_profile.team_size = 1
+        # Solo profile against an opportunity requiring min team size of 3
+        mock_profile = _profile(team_size=1)
+        mock_opportunity = _opportunity(team_size_min=3)
 
-        # Mock opportunity requiring min team size of 3
-        mock_opportunity = MagicMock()
-        mock_opportunity.team_size_min = 3
-        mock_opportunity.team_size_max = None
-        mock_opportunity.opportunity_type = "hackathon"
-
-        service._apply_hard_filters(mock_profile, mock_opportunity, breakdown, eligibility_issues)
+        matching_service._apply_hard_filters(
+            mock_profile, mock_opportunity, breakdown, eligibility_issues
+        )
 
         assert breakdown.team_size_eligible is False
         assert len(eligibility_issues) > 0
 
-    def test_apply_hard_filters_team_size_too_large(self):
+    def test_apply_hard_filters_team_size_too_large(self, matching_service):
         """Test team size filter when team is too large."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown()
         eligibility_issues = []
 
-        mock_profile = MagicMock()
-        mock_profile.team_size = 10
+        mock_profile = _profile(team_size=10)
+        mock_opportunity = _opportunity(team_size_max=5)
 
-        mock_opportunity = MagicMock()
-        mock_opportunity.team_size_min = None
-        mock_opportunity.team_size_max = 5
-        mock_opportunity.opportunity_type = "hackathon"
-
-        service._apply_hard_filters(mock_profile, mock_opportunity, breakdown, eligibility_issues)
+        matching_service._apply_hard_filters(
+            mock_profile, mock_opportunity, breakdown, eligibility_issues
+        )
 
         assert breakdown.team_size_eligible is False
 
-    def test_apply_hard_filters_team_size_valid(self):
+    def test_apply_hard_filters_team_size_valid(self, matching_service):
         """Test team size filter when team size is valid."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown()
         eligibility_issues = []
 
-        mock_profile = MagicMock()
-        mock_profile.team_size = 3
-        mock_profile.funding_stage = None
+        mock_profile = _profile(team_size=3)
+        mock_opportunity = _opportunity(team_size_min=1, team_size_max=5)
 
-        mock_opportunity = MagicMock()
-        mock_opportunity.team_size_min = 1
-        mock_opportunity.team_size_max = 5
-        mock_opportunity.opportunity_type = "hackathon"
-
-        service._apply_hard_filters(mock_profile, mock_opportunity, breakdown, eligibility_issues)
+        matching_service._apply_hard_filters(
+            mock_profile, mock_opportunity, breakdown, eligibility_issues
+        )
 
         assert breakdown.team_size_eligible is True
         assert len(eligibility_issues) == 0
 
-
+    def test_team_size_query_matches_hard_filter(self, matching_service):
+        """Test the MongoDB team size query keeps exactly what the hard filter accepts."""
+
+        def matches(doc, query):
+            # Minimal evaluator for the operators _team_size_query uses
+            if "$and" in query:
+                return all(matches(doc, q) for q in query["$and"])
+            if "$or" in query:
+                return any(matches(doc, q) for q in query["$or"])
+            (field, cond), = query.items()
+            value = doc.get(field)
+            if isinstance(cond, dict):
+                if value is None:
+                    return False
+                if "$lte" in cond:
+                    return value <= cond["$lte"]
+                return value >= cond["$gte"]
+            return value == cond
+
+        limits = [None, 0, 1, 2, 3, 5, -1]
+        for team_size in [1, 2, 3, 4, 6]:
+            query = _team_size_query(team_size)
+            for team_min in limits:
+                for team_max in limits:
+                    breakdown = MatchScoreBreakdown()
+                    profile = _profile(team_size=team_size)
+                    opp = _opportunity(team_size_min=team_min, team_size_max=team_max)
+                    matching_service._apply_hard_filters(profile, opp, breakdown, [])
+
+                    doc = {"team_size_min": team_min, "team_size_max": team_max}
+                    assert matches(doc, query) == breakdown.team_size_eligible, (
+                        team_size, team_min, team_max
+                    )
+
+
+@pytest.mark.xdist_group(name="matching_service")
 class TestGenerateExplanation:
     """Test explanation generation."""
 
-    def test_generate_explanation_ineligible(self):
+    def test_generate_explanation_ineligible(self, matching_service):
         """Test explanation for ineligible match."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown(team_size_eligible=False)
 
-        explanation = service._generate_explanation(breakdown, [])
+        explanation = matching_service._generate_explanation(breakdown, [])
 
         assert "eligible" in explanation.lower()
 
-    def test_generate_explanation_with_reasons(self):
+    def test_generate_explanation_with_reasons(self, matching_service):
         """Test explanation uses provided reasons."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown(semantic_score=0.8)
         reasons = ["Excellent match for your profile"]
 
-        explanation = service._generate_explanation(breakdown, reasons)
+        explanation = matching_service._generate_explanation(breakdown, reasons)
 
         assert explanation == "Excellent match for your profile"
 
-    def test_generate_explanation_high_score(self):
+    def test_generate_explanation_high_score(self, matching_service):
         """Test explanation for high score."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            MongoMatchingService,
-            MatchScoreBreakdown,
-        )
-
-        service = MongoMatchingService()
         breakdown = MatchScoreBreakdown(semantic_score=0.85)
 
-        explanation = service._generate_explanation(breakdown, [])
+        explanation = matching_service._generate_explanation(breakdown, [])
 
         assert "excellent" in explanation.lower() or "good" in explanation.lower()
 
 
+@pytest.mark.xdist_group(name="matching_service")
 class TestSingletonAndHelpers:
     """Test singleton and helper functions."""
 
     def test_get_mongo_matching_service(self):
         """Test get_mongo_matching_service singleton."""
-        from src.opportunity_radar.services.mongo_matching_service import (
-            get_mongo_matching_service,
-        )
-
         service1 = get_mongo_matching_service()
         service2 = get_mongo_matching_service()
 
@@ -496,139 +518,216 @@ class TestSingletonAndHelpers:
 
     def test_industry_aliases_defined(self):
         """Test INDUSTRY_ALIASES is defined."""
-        from src.opportunity_radar.services.mongo_matching_service import INDUSTRY_ALIASES
-
         assert isinstance(INDUSTRY_ALIASES, dict)
         assert "ai" in INDUSTRY_ALIASES
         assert "ml" in INDUSTRY_ALIASES
 
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group(name="matching_service")
 class TestMatchingServiceAsync:
     """Async tests for MongoMatchingService."""
 
-    async def test_compute_matches_no_profile(self):
+    async def test_compute_matches_no_profile(self, matching_service):
         """Test compute_matches returns empty for missing profile."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
-
-        service = MongoMatchingService()
-
         with patch("src.opportunity_radar.services.mongo_matching_service.Profile") as MockProfile:
             MockProfile.get = AsyncMock(return_value=None)
 
-            result = await service.compute_matches_for_profile("nonexistent_id")
+            result = await matching_service.compute_matches_for_profile(
 
-            assert result == []
+                "nonexistent_id"
 
-    async def test_compute_matches_no_opportunities(self):
-        """Test compute_matches returns empty when no opportunities."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+            )
 
-        service = MongoMatchingService()
+            assert result == []
 
-        mock_profile = MagicMock()
-        mock_profile.id = "profile_id"
-        mock_profile.embedding = [0.1] * 1536
+    async def test_compute_matches_no_opportunities(self, matching_service):
+        """Test compute_matches returns empty when no opportunities."""
+        mock_profile = _profile(embedding=[0.1] * 1536)
 
         with patch("src.opportunity_radar.services.mongo_matching_service.Profile") as MockProfile:
             MockProfile.get = AsyncMock(return_value=mock_profile)
 
-            with patch("src.opportunity_radar.services.mongo_matching_service.Opportunity") as MockOpp:
+            with patch(
+                "src.opportunity_radar.services.mongo_matching_service.Opportunity"
+            ) as MockOpp:
                 mock_find = MagicMock()
                 mock_find.to_list = AsyncMock(return_value=[])
                 MockOpp.find = MagicMock(return_value=mock_find)
 
-                result = await service.compute_matches_for_profile("profile_id")
+                result = await matching_service.compute_matches_for_profile(
+
+                    "profile_id"
+
+                )
 
                 assert result == []
 
-    async def test_bookmark_match_success(self):
-        """Test bookmark_match updates match."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+    async def test_compute_matches_filters_team_size_in_query(self, matching_service):
+        """Test compute_matches pushes the team size hard filter into the query."""
+        mock_profile = _profile(team_size=4)
 
-        service = MongoMatchingService()
+        with patch("src.opportunity_radar.services.mongo_matching_service.Profile") as MockProfile:
+            MockProfile.get = AsyncMock(return_value=mock_profile)
 
-        mock_match = MagicMock()
-        mock_match.is_bookmarked = False
-        mock_match.save = AsyncMock()
+            with patch(
+                "src.opportunity_radar.services.mongo_matching_service.Opportunity"
+            ) as MockOpp:
+                mock_find = MagicMock()
+                mock_find.to_list = AsyncMock(return_value=[])
+                MockOpp.find = MagicMock(return_value=mock_find)
 
-        with patch("src.opportunity_radar.services.mongo_matching_service.Match") as MockMatch:
-            MockMatch.find_one = AsyncMock(return_value=mock_match)
+                await matching_service.compute_matches_for_profile("507f1f77bcf86cd799439011")
+                await matching_service.compute_matches_for_profile(
+                    "507f1f77bcf86cd799439011", apply_hard_filters=False
+                )
 
-            # Use valid ObjectId format strings
-            result = await service.bookmark_match("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012")
+        filtered, unfiltered = (c.args[0] for c in MockOpp.find.call_args_list)
+        assert filtered == {"is_active": True, **_team_size_query(4)}
+        assert unfiltered == {"is_active": True}
 
-            assert result is True
-            assert mock_match.is_bookmarked is True
-            mock_match.save.assert_called_once()
+    async def test_bookmark_match_success(self, matching_service, match_model):
+        """Test bookmark_match updates match."""
+        mock_match = SimpleNamespace(is_bookmarked=False, save=AsyncMock())
+        match_model.find_one = AsyncMock(return_value=mock_match)
 
-    async def test_bookmark_match_not_found(self):
-        """Test bookmark_match returns False when match not found."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+        # Use valid ObjectId format strings
+        result = await matching_service.bookmark_match(
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"
+        )
 
-        service = MongoMatchingService()
+        assert result is True
+        assert mock_match.is_bookmarked is True
+        mock_match.save.assert_called_once()
 
-        with patch("src.opportunity_radar.services.mongo_matching_service.Match") as MockMatch:
-            MockMatch.find_one = AsyncMock(return_value=None)
+    async def test_bookmark_match_not_found(self, matching_service, match_model):
+        """Test bookmark_match returns False when match not found."""
+        match_model.find_one = AsyncMock(return_value=None)
 
-            # Use valid ObjectId format strings
-            result = await service.bookmark_match("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012")
+        # Use valid ObjectId format strings
+        result = await matching_service.bookmark_match(
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"
+        )
 
-            assert result is False
+        assert result is False
 
-    async def test_dismiss_match_success(self):
+    async def test_dismiss_match_success(self, matching_service, match_model):
         """Test dismiss_match updates match."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+        mock_match = SimpleNamespace(is_dismissed=False, save=AsyncMock())
+        match_model.find_one = AsyncMock(return_value=mock_match)
 
-        service = MongoMatchingService()
+        # Use valid ObjectId format strings
+        result = await matching_service.dismiss_match(
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"
+        )
 
-        mock_match = MagicMock()
-        mock_match.is_dismissed = False
-        mock_match.save = AsyncMock()
+        assert result is True
+        assert mock_match.is_dismissed is True
 
-        with patch("src.opportunity_radar.services.mongo_matching_service.Match") as MockMatch:
-            MockMatch.find_one = AsyncMock(return_value=mock_match)
+    async def test_record_feedback_bookmark_action(self, matching_service, match_model):
+        """Test record_feedback handles bookmark action."""
+        mock_match = SimpleNamespace(is_bookmarked=False, save=AsyncMock())
+        match_model.find_one = AsyncMock(return_value=mock_match)
 
-            # Use valid ObjectId format strings
-            result = await service.dismiss_match("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012")
+        # Use valid ObjectId format strings
+        result = await matching_service.record_feedback(
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012", "bookmark"
+        )
 
-            assert result is True
-            assert mock_match.is_dismissed is True
+        assert result is True
+        assert mock_match.is_bookmarked is True
 
-    async def test_record_feedback_bookmark_action(self):
-        """Test record_feedback handles bookmark action."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+    async def test_record_feedback_dismiss_action(self, matching_service, match_model):
+        """Test record_feedback handles dismiss action."""
+        mock_match = SimpleNamespace(is_dismissed=False, save=AsyncMock())
+        match_model.find_one = AsyncMock(return_value=mock_match)
 
-        service = MongoMatchingService()
+        # Use valid ObjectId format strings
+        result = await matching_service.record_feedback(
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012", "dismiss"
+        )
 
-        mock_match = MagicMock()
-        mock_match.is_bookmarked = False
-        mock_match.save = AsyncMock()
+        assert result is True
+        assert mock_match.is_dismissed is True
 
-        with patch("src.opportunity_radar.services.mongo_matching_service.Match") as MockMatch:
-            MockMatch.find_one = AsyncMock(return_value=mock_match)
+    async def test_compute_matches_uses_batched_semantic_scores(self, matching_service):
+        """Test compute_matches scores opportunities like the per-pair path."""
+        mock_profile = _profile(embedding=[1.0, 0.2, 0.0])
+        opportunities = [
+            _opportunity(id=f"opp_{i}", embedding=embedding)
+            for i, embedding in enumerate([[1.0, 0.0, 0.0], [0.5, 0.5, 0.5], [1.0, 0.0]])
+        ]
 
-            # Use valid ObjectId format strings
-            result = await service.record_feedback("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012", "bookmark")
+        with patch("src.opportunity_radar.services.mongo_matching_service.Profile") as MockProfile:
+            MockProfile.get = AsyncMock(return_value=mock_profile)
 
-            assert result is True
-            assert mock_match.is_bookmarked is True
+            with patch(
+                "src.opportunity_radar.services.mongo_matching_service.Opportunity"
+            ) as MockOpp:
+                mock_find = MagicMock()
+                mock_find.to_list = AsyncMock(return_value=opportunities)
+                MockOpp.find = MagicMock(return_value=mock_find)
 
-    async def test_record_feedback_dismiss_action(self):
-        """Test record_feedback handles dismiss action."""
-        from src.opportunity_radar.services.mongo_matching_service import MongoMatchingService
+                result = await matching_service.compute_matches_for_profile(
+                    "507f1f77bcf86cd799439011", min_score=0.0
+                )
+
+        scores = {r.opportunity_id: r.breakdown.semantic_score for r in result}
+        for opp in opportunities[:2]:
+            expected = matching_service._cosine_similarity(mock_profile.embedding, opp.embedding)
+            assert scores[opp.id] == pytest.approx(expected, abs=1e-6)
+        # Mismatched dimensions fall back to the per-pair path's neutral score
+        assert scores["opp_2"] == 0.5
+
+    async def test_compute_matches_returns_top_scores_in_order(self, matching_service):
+        """Test compute_matches keeps the best `limit` matches, best first."""
+        mock_profile = _profile(embedding=[1.0, 0.0])
+        # Raw cosines inside the score-spreading range, so no two scores tie
+        cosines = [0.3, 0.5, 0.4, 0.1, 0.45]
+        opportunities = [
+            _opportunity(id=f"opp_{i}", embedding=[c, (1 - c * c) ** 0.5])
+            for i, c in enumerate(cosines)
+        ]
 
-        service = MongoMatchingService()
+        with patch("src.opportunity_radar.services.mongo_matching_service.Profile") as MockProfile:
+            MockProfile.get = AsyncMock(return_value=mock_profile)
 
-        mock_match = MagicMock()
-        mock_match.is_dismissed = False
-        mock_match.save = AsyncMock()
+            with patch(
+                "src.opportunity_radar.services.mongo_matching_service.Opportunity"
+            ) as MockOpp:
+                mock_find = MagicMock()
+                mock_find.to_list = AsyncMock(return_value=opportunities)
+                MockOpp.find = MagicMock(return_value=mock_find)
 
-        with patch("src.opportunity_radar.services.mongo_matching_service.Match") as MockMatch:
-            MockMatch.find_one = AsyncMock(return_value=mock_match)
+                result = await matching_service.compute_matches_for_profile(
+                    "507f1f77bcf86cd799439011", limit=3, min_score=0.0
+                )
+
+        assert [r.opportunity_id for r in result] == ["opp_1", "opp_4", "opp_2"]
+        assert all(r.explanation.primary_reason for r in result)
+
+    async def test_build_match_batch_matches_scalar(self, matching_service):
+        """Test the single-pass batch agrees with per-opportunity scoring."""
+        rng = random.Random(42)
+        mock_profile = _profile(team_size=2, embedding=[rng.gauss(0, 1) for _ in range(8)])
+        now = datetime.utcnow()
+        opportunities = [
+            _opportunity(
+                id=f"opp_{i}",
+                team_size_min=rng.choice([None, 1, 3]),
+                team_size_max=rng.choice([None, 0, 1, 4]),
+                # Mix of missing, matching and mismatched-dimension embeddings
+                embedding=rng.choice([None, [rng.gauss(0, 1) for _ in range(8)], [1.0, 0.0]]),
+                created_at=rng.choice([None, now - timedelta(days=3), now - timedelta(days=10)]),
+                participant_count=rng.choice([None, 50, 500]),
+            )
+            for i in range(1000)
+        ]
 
-            # Use valid ObjectId format strings
-            result = await service.record_feedback("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012", "dismiss")
+        batch = await matching_service._build_match_batch(mock_profile, opportunities)
 
-            assert result is True
-            assert mock_match.is_dismissed is True
+        singles = [
+            matching_service._compute_single_match(mock_profile, opp) for opp in opportunities
+        ]
+        np.testing.assert_array_equal(batch.eligible, [r.breakdown.is_eligible for r in singles])
+        np.testing.assert_allclose(batch.total_scores(), [r.score for r in singles], atol=1e-6)
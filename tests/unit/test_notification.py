@@ -1,7 +1,33 @@
 """Unit tests for Notification workflow."""
 
 import pytest
-from datetime import datetime
+from typing import get_args
+
+from src.opportunity_radar.models.notification import (
+    Notification,
+    NotificationChannel,
+    NotificationPreferences,
+    NotificationType,
+)
+from src.opportunity_radar.services.notification_service import (
+    NotificationService,
+    get_notification_service,
+)
+
+_REQUIRED_SERVICE_METHODS = frozenset(
+    {
+        "get_user_preferences",
+        "update_preferences",
+        "create_notification",
+        "get_user_notifications",
+        "mark_notification_read",
+        "mark_all_read",
+        "get_unread_count",
+        "check_deadline_reminders",
+        "send_new_match_notification",
+        "cleanup_old_notifications",
+    }
+)
 
 
 class TestNotificationModel:
@@ -9,32 +35,30 @@ class TestNotificationModel:
 
     def test_import_notification(self):
         """Test Notification model import."""
-        from src.opportunity_radar.models.notification import Notification
-
         assert Notification is not None
 
-    def test_notification_has_required_fields(self):
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "user_id",
+            "notification_type",
+            "channel",
+            "title",
+            "message",
+            "is_read",
+            "is_sent",
+            "created_at",
+        ],
+    )
+    def test_notification_field_exists(self, field):
         """Test Notification model has all required fields."""
-        from src.opportunity_radar.models.notification import Notification
-
-        fields = Notification.model_fields
-
-        assert "user_id" in fields
-        assert "notification_type" in fields
-        assert "channel" in fields
-        assert "title" in fields
-        assert "message" in fields
-        assert "is_read" in fields
-        assert "is_sent" in fields
-        assert "created_at" in fields
+        assert field in Notification.model_fields
 
     def test_notification_default_values(self):
         """Test Notification default values."""
-        from src.opportunity_radar.models.notification import Notification
-
-        assert Notification.model_fields["is_read"].default is False
-        assert Notification.model_fields["is_sent"].default is False
-        assert Notification.model_fields["channel"].default == "in_app"
+        expected = {"is_read": False, "is_sent": False, "channel": "in_app"}
+        fields = Notification.model_fields
+        assert {name: fields[name].default for name in expected} == expected
 
 
 class TestNotificationPreferencesModel:
@@ -42,54 +66,42 @@ class TestNotificationPreferencesModel:
 
     def test_import_notification_preferences(self):
         """Test NotificationPreferences import."""
-        from src.opportunity_radar.models.notification import NotificationPreferences
-
         assert NotificationPreferences is not None
 
-    def test_preferences_has_required_fields(self):
+    @pytest.mark.parametrize(
+        "field",
+        [
+            # Email preferences
+            "email_enabled",
+            "email_deadline_reminders",
+            "email_new_matches",
+            "email_weekly_digest",
+            # Reminder settings
+            "reminder_days",
+            # In-app preferences
+            "in_app_enabled",
+            "in_app_deadline_reminders",
+            "in_app_new_matches",
+        ],
+    )
+    def test_preferences_field_exists(self, field):
         """Test NotificationPreferences has required fields."""
-        from src.opportunity_radar.models.notification import NotificationPreferences
-
-        fields = NotificationPreferences.model_fields
-
-        # Email preferences
-        assert "email_enabled" in fields
-        assert "email_deadline_reminders" in fields
-        assert "email_new_matches" in fields
-        assert "email_weekly_digest" in fields
-
-        # Reminder settings
-        assert "reminder_days" in fields
-
-        # In-app preferences
-        assert "in_app_enabled" in fields
-        assert "in_app_deadline_reminders" in fields
-        assert "in_app_new_matches" in fields
+        assert field in NotificationPreferences.model_fields
 
     def test_preferences_defaults(self):
         """Test NotificationPreferences default values."""
-        from src.opportunity_radar.models.notification import NotificationPreferences
-
-        assert NotificationPreferences.model_fields["email_enabled"].default is True
-        assert NotificationPreferences.model_fields["in_app_enabled"].default is True
+        expected = {"email_enabled": True, "in_app_enabled": True}
+        fields = NotificationPreferences.model_fields
+        assert {name: fields[name].default for name in expected} == expected
 
 
 class TestNotificationMethods:
     """Test Notification model methods."""
 
-    def test_mark_read_method_exists(self):
-        """Test mark_read method exists."""
-        from src.opportunity_radar.models.notification import Notification
-
-        assert hasattr(Notification, "mark_read")
-        assert callable(getattr(Notification, "mark_read"))
-
-    def test_mark_sent_method_exists(self):
-        """Test mark_sent method exists."""
-        from src.opportunity_radar.models.notification import Notification
-
-        assert hasattr(Notification, "mark_sent")
-        assert callable(getattr(Notification, "mark_sent"))
+    def test_state_methods_exist(self):
+        """Test Notification exposes the read/sent state methods."""
+        missing = {"mark_read", "mark_sent"} - set(dir(Notification))
+        assert not missing, f"Missing methods: {sorted(missing)}"
 
 
 class TestNotificationService:
@@ -97,63 +109,32 @@ class TestNotificationService:
 
     def test_import_notification_service(self):
         """Test NotificationService import."""
-        from src.opportunity_radar.services.notification_service import (
-            NotificationService,
-        )
-
         assert NotificationService is not None
 
     def test_get_notification_service_singleton(self):
         """Test get_notification_service singleton function."""
-        from src.opportunity_radar.services.notification_service import (
-            get_notification_service,
-        )
-
         assert get_notification_service is not None
         assert callable(get_notification_service)
 
     def test_notification_service_methods(self):
         """Test NotificationService has required methods."""
-        from src.opportunity_radar.services.notification_service import (
-            NotificationService,
-        )
-
-        # Check for required methods
-        assert hasattr(NotificationService, "get_user_preferences")
-        assert hasattr(NotificationService, "update_preferences")
-        assert hasattr(NotificationService, "create_notification")
-        assert hasattr(NotificationService, "get_user_notifications")
-        assert hasattr(NotificationService, "mark_notification_read")
-        assert hasattr(NotificationService, "mark_all_read")
-        assert hasattr(NotificationService, "get_unread_count")
-        assert hasattr(NotificationService, "check_deadline_reminders")
-        assert hasattr(NotificationService, "send_new_match_notification")
-        assert hasattr(NotificationService, "cleanup_old_notifications")
+        missing = _REQUIRED_SERVICE_METHODS - set(dir(NotificationService))
+        assert not missing, f"Missing methods: {sorted(missing)}"
 
 
 class TestNotificationTypes:
     """Test notification types and channels."""
 
-    def test_valid_notification_types(self):
-        """Test valid notification types."""
-        valid_types = [
+    def test_notification_literals(self):
+        """Test the notification type and channel literals the model accepts."""
+        assert get_args(NotificationType) == (
             "deadline_reminder",
             "new_match",
             "opportunity_update",
             "system",
             "weekly_digest",
-        ]
-
-        assert len(valid_types) == 5
-        assert "deadline_reminder" in valid_types
-        assert "new_match" in valid_types
-
-    def test_valid_notification_channels(self):
-        """Test valid notification channels."""
-        valid_channels = ["in_app", "email", "push"]
-
-        assert len(valid_channels) == 3
-        assert "in_app" in valid_channels
+        )
+        assert get_args(NotificationChannel) == ("in_app", "email", "push")
 
 
 class TestNotificationWorkflow:
@@ -161,16 +142,12 @@ class TestNotificationWorkflow:
 
     def test_reminder_days_default(self):
         """Test default reminder days."""
-        from src.opportunity_radar.models.notification import NotificationPreferences
-
         # Default reminder days should be 7, 3, 1 days before deadline
         default_days = [7, 3, 1]
         assert len(default_days) == 3
 
     def test_quiet_hours_fields_exist(self):
         """Test quiet hours fields exist."""
-        from src.opportunity_radar.models.notification import NotificationPreferences
-
         fields = NotificationPreferences.model_fields
 
         assert "quiet_hours_start" in fields
@@ -2,7 +2,111 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-import ipaddress
+import socket
+from pydantic import ValidationError
+
+import src.opportunity_radar.services.onboarding_service as _onb_mod
+from src.opportunity_radar.schemas.onboarding import (
+    ExtractedField,
+    ExtractedProfile,
+    OnboardingConfirmRequest,
+    URLType,
+)
+from src.opportunity_radar.services.onboarding_service import (
+    GOALS_NORMALIZATION_MAP,
+    VALID_GOALS,
+    OnboardingService,
+    SSRFProtectionError,
+    get_onboarding_service,
+    normalize_goals,
+    validate_url_for_ssrf,
+)
+
+# The code paths under test never touch the OpenAI or HTTP clients; they only
+# need the attributes to exist
+_STUB_CLIENT = object()
+
+_REQUIRED_SERVICE_METHODS = frozenset(
+    {
+        "extract_profile_from_url",
+        "detect_url_type",
+        "confirm_profile",
+        "get_onboarding_status",
+    }
+)
+
+_EXPECTED_VALID_GOALS = frozenset(
+    {
+        "funding",
+        "prizes",
+        "learning",
+        "networking",
+        "exposure",
+        "mentorship",
+        "equity",
+        "building",
+    }
+)
+
+# Request payloads are never mutated by confirm_profile, so build them once
+# and skip validation (the schema tests cover that)
+_NEW_REQ = OnboardingConfirmRequest.model_construct(
+    display_name="My Project",
+    tech_stack=["Python"],
+    goals=["funding"],
+)
+_UPDATE_REQ = OnboardingConfirmRequest.model_construct(
+    display_name="Updated Project",
+    tech_stack=["Python", "FastAPI"],
+    goals=["networking"],
+)
+
+_GITHUB_URL_VARIANTS = (
+    "https://github.com/user/repo",
+    "http://github.com/user/repo",
+    "https://www.github.com/user/repo",
+)
+
+
+def _async_return(value):
+    """Cheap stand-in for AsyncMock(return_value=value) when calls aren't asserted."""
+
+    async def _coro(*args, **kwargs):
+        return value
+
+    return _coro
+
+
+def _bare():
+    """Build an OnboardingService with stand-in clients."""
+    # Bypass __init__ so no real OpenAI or HTTP client is created
+    service = OnboardingService.__new__(OnboardingService)
+    service.openai_client = _STUB_CLIENT
+    service.http_client = _STUB_CLIENT
+    return service
+
+
+@pytest.fixture(scope="module")
+def stub_service():
+    """One bare OnboardingService, shared by read-only tests."""
+    return _bare()
+
+
+@pytest.fixture
+def bare_service():
+    """A fresh bare OnboardingService.
+
+    Function-scoped because tests attach their own mocks for the scrape and
+    extraction helpers.
+    """
+    return _bare()
+
+
+@pytest.fixture
+def mock_profile_cls():
+    """Patch the Profile document used by the onboarding service."""
+    with patch.object(_onb_mod, "Profile") as mock_cls:
+        yield mock_cls
 
 
 class TestSSRFProtection:
@@ -10,96 +114,48 @@ class TestSSRFProtection:
 
     def test_ssrf_protection_error_import(self):
         """Test SSRFProtectionError can be imported."""
-        from src.opportunity_radar.services.onboarding_service import SSRFProtectionError
         assert SSRFProtectionError is not None
 
     def test_validate_url_for_ssrf_import(self):
         """Test validate_url_for_ssrf can be imported."""
-        from src.opportunity_radar.services.onboarding_service import validate_url_for_ssrf
         assert validate_url_for_ssrf is not None
 
-    def test_validate_url_blocks_localhost(self):
-        """Test SSRF validation blocks localhost."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://localhost/admin")
-
-    def test_validate_url_blocks_127_0_0_1(self):
-        """Test SSRF validation blocks 127.0.0.1."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://127.0.0.1/admin")
-
-    def test_validate_url_blocks_private_ip(self):
-        """Test SSRF validation blocks private IP ranges."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
-        # 10.x.x.x
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://10.0.0.1/internal")
-
-        # 192.168.x.x
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://192.168.1.1/internal")
-
-        # 172.16.x.x
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://172.16.0.1/internal")
-
-    def test_validate_url_blocks_aws_metadata(self):
-        """Test SSRF validation blocks AWS metadata endpoint."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://169.254.169.254/latest/meta-data/")
-
-    def test_validate_url_blocks_gcp_metadata(self):
-        """Test SSRF validation blocks GCP metadata endpoint."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("http://metadata.google.internal/")
-
-    def test_validate_url_blocks_non_http_schemes(self):
-        """Test SSRF validation blocks non-HTTP schemes."""
-        from src.opportunity_radar.services.onboarding_service import (
-            validate_url_for_ssrf,
-            SSRFProtectionError,
-        )
-
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "http://localhost/admin",
+            "http://127.0.0.1/admin",
+            # Private ranges
+            "http://10.0.0.1/internal",
+            "http://192.168.1.1/internal",
+            "http://172.16.0.1/internal",
+            # Cloud metadata endpoints
+            "http://169.254.169.254/latest/meta-data/",
+            "http://metadata.google.internal/",
+            # Non-HTTP schemes
+            "file:///etc/passwd",
+            "ftp://internal.server/",
+        ],
+    )
+    def test_validate_url_blocks(self, url):
+        """Test SSRF validation blocks internal hosts and non-HTTP schemes."""
         with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("file:///etc/passwd")
+            validate_url_for_ssrf(url)
 
-        with pytest.raises(SSRFProtectionError):
-            validate_url_for_ssrf("ftp://internal.server/")
-
-    def test_validate_url_allows_valid_urls(self):
+    def test_validate_url_allows_valid_urls(self, monkeypatch):
         """Test SSRF validation allows valid external URLs."""
-        from src.opportunity_radar.services.onboarding_service import validate_url_for_ssrf
+        # Resolve every host to a public address so the test needs no network
+        monkeypatch.setattr(
+            _onb_mod.socket,
+            "getaddrinfo",
+            lambda *args, **kwargs: [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 443))
+            ],
+        )
 
         # Should not raise for valid external URLs
-        try:
-            validate_url_for_ssrf("https://github.com/user/repo")
-            validate_url_for_ssrf("https://example.com")
-        except Exception:
-            pass  # May fail on network resolution in test env
+        validate_url_for_ssrf("https://github.com/user/repo")
+        validate_url_for_ssrf("https://example.com")
 
 
 class TestGoalsNormalization:
@@ -107,57 +163,28 @@ class TestGoalsNormalization:
 
     def test_normalize_goals_import(self):
         """Test normalize_goals can be imported."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
         assert normalize_goals is not None
 
-    def test_normalize_goals_empty(self):
-        """Test normalize_goals with empty list."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
-        result = normalize_goals([])
-        assert result == []
-
-    def test_normalize_goals_none(self):
-        """Test normalize_goals with None."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
-        result = normalize_goals(None)
-        assert result == []
-
-    def test_normalize_goals_valid_goals(self):
-        """Test normalize_goals with valid standard goals."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
-        result = normalize_goals(["funding", "prizes", "learning"])
-
-        assert "funding" in result
-        assert "prizes" in result
-        assert "learning" in result
-
-    def test_normalize_goals_maps_synonyms(self):
-        """Test normalize_goals maps synonyms to standard values."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
-        result = normalize_goals(["get_funding", "win_prizes", "network"])
-
-        assert "funding" in result
-        assert "prizes" in result
-        assert "networking" in result
-
-    def test_normalize_goals_case_insensitive(self):
-        """Test normalize_goals is case insensitive."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
-        result = normalize_goals(["FUNDING", "Prizes", "LeArNiNg"])
-
-        assert "funding" in result
-        assert "prizes" in result
-        assert "learning" in result
+    @pytest.mark.parametrize("goals", [[], None], ids=["empty", "none"])
+    def test_normalize_goals_empty(self, goals):
+        """Test normalize_goals with no goals."""
+        assert normalize_goals(goals) == []
+
+    @pytest.mark.parametrize(
+        "goals,expected",
+        [
+            (["funding", "prizes", "learning"], {"funding", "prizes", "learning"}),
+            (["get_funding", "win_prizes", "network"], {"funding", "prizes", "networking"}),
+            (["FUNDING", "Prizes", "LeArNiNg"], {"funding", "prizes", "learning"}),
+        ],
+        ids=["valid-goals", "synonyms", "case-insensitive"],
+    )
+    def test_normalize_goals(self, goals, expected):
+        """Test normalize_goals keeps, maps and lowercases goals."""
+        assert set(normalize_goals(goals)) >= expected
 
     def test_normalize_goals_deduplicates(self):
         """Test normalize_goals removes duplicates."""
-        from src.opportunity_radar.services.onboarding_service import normalize_goals
-
         result = normalize_goals(["funding", "get_funding", "raise_money"])
 
         # All map to "funding", should only appear once
@@ -167,53 +194,22 @@ class TestGoalsNormalization:
 class TestURLTypeDetection:
     """Test URL type detection."""
 
-    def test_detect_url_type_github(self):
+    def test_detect_url_type_github(self, stub_service):
         """Test detecting GitHub URLs."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-        from src.opportunity_radar.schemas.onboarding import URLType
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-
-            result = service.detect_url_type("https://github.com/user/repo")
+        result = stub_service.detect_url_type("https://github.com/user/repo")
 
-            assert result == URLType.GITHUB_REPO
+        assert result == URLType.GITHUB_REPO
 
-    def test_detect_url_type_website(self):
+    def test_detect_url_type_website(self, stub_service):
         """Test detecting regular website URLs."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-        from src.opportunity_radar.schemas.onboarding import URLType
+        result = stub_service.detect_url_type("https://example.com")
 
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
+        assert result == URLType.WEBSITE
 
-            result = service.detect_url_type("https://example.com")
-
-            assert result == URLType.WEBSITE
-
-    def test_detect_url_type_github_variations(self):
+    @pytest.mark.parametrize("url", _GITHUB_URL_VARIANTS)
+    def test_detect_url_type_github_variations(self, stub_service, url):
         """Test detecting various GitHub URL formats."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-        from src.opportunity_radar.schemas.onboarding import URLType
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-
-            urls = [
-                "https://github.com/user/repo",
-                "http://github.com/user/repo",
-                "https://www.github.com/user/repo",
-            ]
-
-            for url in urls:
-                result = service.detect_url_type(url)
-                assert result == URLType.GITHUB_REPO, f"Failed for {url}"
+        assert stub_service.detect_url_type(url) == URLType.GITHUB_REPO
 
 
 class TestOnboardingServiceStructure:
@@ -221,27 +217,15 @@ class TestOnboardingServiceStructure:
 
     def test_service_import(self):
         """Test OnboardingService can be imported."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
         assert OnboardingService is not None
 
     def test_service_has_required_methods(self):
         """Test OnboardingService has all required methods."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
-        required_methods = [
-            "extract_profile_from_url",
-            "detect_url_type",
-            "confirm_profile",
-            "get_onboarding_status",
-        ]
-
-        for method in required_methods:
-            assert hasattr(OnboardingService, method), f"Missing method: {method}"
+        missing = _REQUIRED_SERVICE_METHODS - set(dir(OnboardingService))
+        assert not missing, f"Missing methods: {sorted(missing)}"
 
     def test_max_redirects_constant(self):
         """Test MAX_REDIRECTS constant is defined."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
         assert hasattr(OnboardingService, "MAX_REDIRECTS")
         assert OnboardingService.MAX_REDIRECTS == 5
 
@@ -251,16 +235,13 @@ class TestOnboardingSchemas:
 
     def test_url_type_enum(self):
         """Test URLType enum."""
-        from src.opportunity_radar.schemas.onboarding import URLType
-
         assert URLType.WEBSITE is not None
         assert URLType.GITHUB_REPO is not None
 
     def test_extracted_field_schema(self):
         """Test ExtractedField schema."""
-        from src.opportunity_radar.schemas.onboarding import ExtractedField
-
-        field = ExtractedField(
+        # Validation itself is covered by the *_validation tests below
+        field = ExtractedField.model_construct(
             value="Test Company",
             confidence=0.9,
             source="website",
@@ -272,9 +253,7 @@ class TestOnboardingSchemas:
 
     def test_extracted_profile_schema(self):
         """Test ExtractedProfile schema."""
-        from src.opportunity_radar.schemas.onboarding import ExtractedProfile, URLType
-
-        profile = ExtractedProfile(
+        profile = ExtractedProfile.model_construct(
             url_type=URLType.WEBSITE,
             source_url="https://example.com",
         )
@@ -284,9 +263,7 @@ class TestOnboardingSchemas:
 
     def test_onboarding_confirm_request_schema(self):
         """Test OnboardingConfirmRequest schema."""
-        from src.opportunity_radar.schemas.onboarding import OnboardingConfirmRequest
-
-        request = OnboardingConfirmRequest(
+        request = OnboardingConfirmRequest.model_construct(
             display_name="My Project",
             tech_stack=["Python", "FastAPI"],
             goals=["funding", "networking"],
@@ -296,205 +273,142 @@ class TestOnboardingSchemas:
         assert len(request.tech_stack) == 2
         assert len(request.goals) == 2
 
+    def test_extracted_field_confidence_validation(self):
+        """Test ExtractedField rejects confidence outside 0-1."""
+        with pytest.raises(ValidationError):
+            ExtractedField(value="Test Company", confidence=1.5, source="website")
+
+    def test_onboarding_confirm_request_validation(self):
+        """Test OnboardingConfirmRequest requires at least one tech stack item."""
+        with pytest.raises(ValidationError):
+            OnboardingConfirmRequest(display_name="My Project", tech_stack=[], goals=["funding"])
+
 
 @pytest.mark.asyncio
 class TestOnboardingServiceAsync:
     """Async tests for OnboardingService."""
 
-    async def test_extract_profile_adds_https(self):
+    async def test_extract_profile_adds_https(self, bare_service, monkeypatch):
         """Test extract_profile_from_url adds https if missing."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
+        # Mock internal methods
+        bare_service._scrape_website = _async_return("Test content")
+        bare_service._llm_extract = _async_return({})
 
-            # Mock internal methods
-            service._scrape_website = AsyncMock(return_value="Test content")
-            service._llm_extract = AsyncMock(return_value={})
+        monkeypatch.setattr(_onb_mod, "validate_url_for_ssrf", lambda url: None)
 
-            # Should add https
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.validate_url_for_ssrf"
-            ):
-                result = await service.extract_profile_from_url("example.com")
+        # Should add https
+        result = await bare_service.extract_profile_from_url("example.com")
 
-            assert result.source_url == "https://example.com"
+        assert result.source_url == "https://example.com"
 
-    async def test_extract_profile_calls_github_for_github_urls(self):
+    async def test_extract_profile_calls_github_for_github_urls(self, bare_service, monkeypatch):
         """Test extract_profile_from_url uses GitHub scraper for GitHub URLs."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
+        bare_service._scrape_github = AsyncMock(return_value="GitHub content")
+        bare_service._scrape_website = AsyncMock(return_value="Website content")
+        bare_service._llm_extract = _async_return({})
 
-            service._scrape_github = AsyncMock(return_value="GitHub content")
-            service._scrape_website = AsyncMock(return_value="Website content")
-            service._llm_extract = AsyncMock(return_value={})
+        monkeypatch.setattr(_onb_mod, "validate_url_for_ssrf", lambda url: None)
 
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.validate_url_for_ssrf"
-            ):
-                await service.extract_profile_from_url("https://github.com/user/repo")
+        await bare_service.extract_profile_from_url("https://github.com/user/repo")
 
-            service._scrape_github.assert_called_once()
-            service._scrape_website.assert_not_called()
+        bare_service._scrape_github.assert_called_once()
+        bare_service._scrape_website.assert_not_called()
 
-    async def test_get_onboarding_status_no_profile(self):
+    async def test_get_onboarding_status_no_profile(self, bare_service, mock_profile_cls):
         """Test get_onboarding_status when user has no profile."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-
-            mock_user = MagicMock()
-            mock_user.id = "user_id"
+        mock_user = MagicMock()
+        mock_user.id = "user_id"
 
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.Profile"
-            ) as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=None)
+        mock_profile_cls.find_one = _async_return(None)
 
-                result = await service.get_onboarding_status(mock_user)
+        result = await bare_service.get_onboarding_status(mock_user)
 
-            assert result["has_profile"] is False
-            assert result["onboarding_completed"] is False
-            assert result["profile_id"] is None
+        assert result["has_profile"] is False
+        assert result["onboarding_completed"] is False
+        assert result["profile_id"] is None
 
-    async def test_get_onboarding_status_with_profile(self):
+    async def test_get_onboarding_status_with_profile(self, bare_service, mock_profile_cls):
         """Test get_onboarding_status when user has profile."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
+        mock_user = MagicMock()
+        mock_user.id = "user_id"
 
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
+        mock_profile = MagicMock()
+        mock_profile.id = "profile_id"
+        mock_profile.tech_stack = ["Python"]
+        mock_profile.goals = ["funding"]
+        mock_profile.bio = "Test bio"
 
-            mock_user = MagicMock()
-            mock_user.id = "user_id"
+        mock_profile_cls.find_one = _async_return(mock_profile)
 
-            mock_profile = MagicMock()
-            mock_profile.id = "profile_id"
-            mock_profile.tech_stack = ["Python"]
-            mock_profile.goals = ["funding"]
-            mock_profile.bio = "Test bio"
+        result = await bare_service.get_onboarding_status(mock_user)
 
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.Profile"
-            ) as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=mock_profile)
+        assert result["has_profile"] is True
+        assert result["onboarding_completed"] is True
+        assert result["profile_id"] == "profile_id"
 
-                result = await service.get_onboarding_status(mock_user)
-
-            assert result["has_profile"] is True
-            assert result["onboarding_completed"] is True
-            assert result["profile_id"] == "profile_id"
-
-    async def test_get_onboarding_status_incomplete_profile(self):
+    async def test_get_onboarding_status_incomplete_profile(self, bare_service, mock_profile_cls):
         """Test get_onboarding_status with incomplete profile."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-
-            mock_user = MagicMock()
-            mock_user.id = "user_id"
-
-            mock_profile = MagicMock()
-            mock_profile.id = "profile_id"
-            # Empty lists and None bio mean profile is incomplete
-            mock_profile.tech_stack = []
-            mock_profile.goals = []
-            mock_profile.bio = None
-
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.Profile"
-            ) as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=mock_profile)
-
-                result = await service.get_onboarding_status(mock_user)
-
-            assert result["has_profile"] is True
-            # When tech_stack is empty, goals is empty, and bio is None,
-            # the profile is considered incomplete
-            # The actual check is: has_tech_stack or has_goals or has_bio
-            # All are falsy, so onboarding_completed should be False
-            assert result.get("onboarding_completed") is False or result.get("onboarding_completed") is None
-
-    async def test_confirm_profile_creates_new(self):
-        """Test confirm_profile creates new profile."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-        from src.opportunity_radar.schemas.onboarding import OnboardingConfirmRequest
-
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-            service._generate_profile_embedding = MagicMock(return_value=None)
+        mock_user = MagicMock()
+        mock_user.id = "user_id"
+
+        mock_profile = MagicMock()
+        mock_profile.id = "profile_id"
+        # Empty lists and None bio mean profile is incomplete
+        mock_profile.tech_stack = []
+        mock_profile.goals = []
+        mock_profile.bio = None
+
+        mock_profile_cls.find_one = _async_return(mock_profile)
+
+        result = await bare_service.get_onboarding_status(mock_user)
+
+        assert result["has_profile"] is True
+        # When tech_stack is empty, goals is empty, and bio is None,
+        # the profile is considered incomplete
+        # The actual check is: has_tech_stack or has_goals or has_bio
+        # All are falsy, so onboarding_completed should be False
+        assert (
+            result.get("onboarding_completed") is False
+            or result.get("onboarding_completed") is None
+        )
 
-            mock_user = MagicMock()
-            mock_user.id = "user_id"
+    async def test_confirm_profile_creates_new(self, bare_service, mock_profile_cls):
+        """Test confirm_profile creates new profile."""
+        bare_service._generate_profile_embedding = MagicMock(return_value=None)
 
-            mock_profile = MagicMock()
-            mock_profile.id = "new_profile_id"
-            mock_profile.insert = AsyncMock()
+        mock_user = MagicMock()
+        mock_user.id = "user_id"
 
-            data = OnboardingConfirmRequest(
-                display_name="My Project",
-                tech_stack=["Python"],
-                goals=["funding"],
-            )
+        mock_profile = MagicMock()
+        mock_profile.id = "new_profile_id"
+        mock_profile.insert = AsyncMock()
 
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.Profile"
-            ) as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=None)
-                MockProfile.return_value = mock_profile
+        mock_profile_cls.find_one = _async_return(None)
+        mock_profile_cls.return_value = mock_profile
 
-                result = await service.confirm_profile(mock_user, data)
+        result = await bare_service.confirm_profile(mock_user, _NEW_REQ)
 
-            mock_profile.insert.assert_called_once()
+        assert result is mock_profile
+        mock_profile.insert.assert_called_once()
 
-    async def test_confirm_profile_updates_existing(self):
+    async def test_confirm_profile_updates_existing(self, bare_service, mock_profile_cls):
         """Test confirm_profile updates existing profile."""
-        from src.opportunity_radar.services.onboarding_service import OnboardingService
-        from src.opportunity_radar.schemas.onboarding import OnboardingConfirmRequest
+        bare_service._generate_profile_embedding = MagicMock(return_value=None)
 
-        with patch.object(OnboardingService, "__init__", lambda self: None):
-            service = OnboardingService()
-            service.openai_client = MagicMock()
-            service.http_client = MagicMock()
-            service._generate_profile_embedding = MagicMock(return_value=None)
+        mock_user = MagicMock()
+        mock_user.id = "user_id"
 
-            mock_user = MagicMock()
-            mock_user.id = "user_id"
+        mock_profile = MagicMock()
+        mock_profile.id = "existing_profile_id"
+        mock_profile.save = AsyncMock()
 
-            mock_profile = MagicMock()
-            mock_profile.id = "existing_profile_id"
-            mock_profile.save = AsyncMock()
+        mock_profile_cls.find_one = _async_return(mock_profile)
 
-            data = OnboardingConfirmRequest(
-                display_name="Updated Project",
-                tech_stack=["Python", "FastAPI"],
-                goals=["networking"],
-            )
+        result = await bare_service.confirm_profile(mock_user, _UPDATE_REQ)
 
-            with patch(
-                "src.opportunity_radar.services.onboarding_service.Profile"
-            ) as MockProfile:
-                MockProfile.find_one = AsyncMock(return_value=mock_profile)
-
-                result = await service.confirm_profile(mock_user, data)
-
-            mock_profile.save.assert_called_once()
-            assert mock_profile.display_name == "Updated Project"
+        assert result is mock_profile
+        mock_profile.save.assert_called_once()
+        assert mock_profile.display_name == "Updated Project"
 
 
 class TestGoalsNormalizationMap:
@@ -502,34 +416,20 @@ class TestGoalsNormalizationMap:
 
     def test_goals_map_exists(self):
         """Test GOALS_NORMALIZATION_MAP is defined."""
-        from src.opportunity_radar.services.onboarding_service import (
-            GOALS_NORMALIZATION_MAP,
-        )
-
         assert isinstance(GOALS_NORMALIZATION_MAP, dict)
         assert len(GOALS_NORMALIZATION_MAP) > 0
 
     def test_goals_map_covers_funding(self):
         """Test goals map covers funding-related terms."""
-        from src.opportunity_radar.services.onboarding_service import (
-            GOALS_NORMALIZATION_MAP,
-        )
-
-        funding_terms = ["get_funding", "raise_money", "investment"]
-        for term in funding_terms:
-            assert term in GOALS_NORMALIZATION_MAP
-            assert GOALS_NORMALIZATION_MAP[term] == "funding"
+        funding_terms = ("get_funding", "raise_money", "investment")
+        mapped = {term: GOALS_NORMALIZATION_MAP.get(term) for term in funding_terms}
+        assert mapped == dict.fromkeys(funding_terms, "funding")
 
     def test_goals_map_covers_learning(self):
         """Test goals map covers learning-related terms."""
-        from src.opportunity_radar.services.onboarding_service import (
-            GOALS_NORMALIZATION_MAP,
-        )
-
-        learning_terms = ["learn", "learn_skills", "education"]
-        for term in learning_terms:
-            assert term in GOALS_NORMALIZATION_MAP
-            assert GOALS_NORMALIZATION_MAP[term] == "learning"
+        learning_terms = ("learn", "learn_skills", "education")
+        mapped = {term: GOALS_NORMALIZATION_MAP.get(term) for term in learning_terms}
+        assert mapped == dict.fromkeys(learning_terms, "learning")
 
 
 class TestValidGoals:
@@ -537,27 +437,12 @@ class TestValidGoals:
 
     def test_valid_goals_exists(self):
         """Test VALID_GOALS is defined."""
-        from src.opportunity_radar.services.onboarding_service import VALID_GOALS
-
         assert isinstance(VALID_GOALS, set)
         assert len(VALID_GOALS) > 0
 
     def test_valid_goals_content(self):
         """Test VALID_GOALS contains expected values."""
-        from src.opportunity_radar.services.onboarding_service import VALID_GOALS
-
-        expected = {
-            "funding",
-            "prizes",
-            "learning",
-            "networking",
-            "exposure",
-            "mentorship",
-            "equity",
-            "building",
-        }
-
-        assert VALID_GOALS == expected
+        assert VALID_GOALS == _EXPECTED_VALID_GOALS
 
 
 class TestSingleton:
@@ -565,17 +450,17 @@ class TestSingleton:
 
     def test_get_onboarding_service(self):
         """Test get_onboarding_service returns singleton."""
-        from src.opportunity_radar.services.onboarding_service import (
-            get_onboarding_service,
-        )
-
         # Reset singleton for test
-        import src.opportunity_radar.services.onboarding_service as module
+        _onb_mod._onboarding_service = None
 
-        module._onboarding_service = None
-
-        with patch.object(module.OnboardingService, "__init__", lambda self: None):
+        original_init = OnboardingService.__init__
+        OnboardingService.__init__ = lambda self: None
+        try:
             service1 = get_onboarding_service()
             service2 = get_onboarding_service()
 
             assert service1 is service2
+        finally:
+            OnboardingService.__init__ = original_init
+            # Don't leak the client-less instance to later tests
+            _onb_mod._onboarding_service = None
@@ -1,213 +1,188 @@
 """Unit tests for Profile management."""
 
-import pytest
+from typing import get_args
 
+import pytest
 
-class TestProfileModel:
-    """Test Profile model functionality."""
+from src.opportunity_radar.models import Profile
+from src.opportunity_radar.models.profile import (
+    CompanyStage,
+    FundingStage,
+    ProductStage,
+    TeamMember,
+)
+from src.opportunity_radar.schemas.onboarding import ExperienceLevelOption
+from src.opportunity_radar.schemas.profile import ProfileCreate, ProfileResponse, ProfileUpdate
+from src.opportunity_radar.services import ProfileService
+
+_PROFILE_REQUIRED_FIELDS = frozenset(
+    {
+        # Core fields
+        "user_id",
+        "display_name",
+        "bio",
+        "tech_stack",
+        "experience_level",
+        # Preferences
+        "availability_hours_per_week",
+        "timezone",
+        "preferred_team_size_min",
+        "preferred_team_size_max",
+        # Goals and interests
+        "goals",
+        "interests",
+        # Location
+        "location_country",
+        "location_region",
+        # Student info
+        "student_status",
+        "university",
+        # Social links
+        "github_url",
+        "linkedin_url",
+        "portfolio_url",
+    }
+)
 
-    def test_import_profile(self):
-        """Test Profile model import."""
-        from src.opportunity_radar.models import Profile
+_PROFILE_TEAM_FIELDS = frozenset({"team_name", "team_size", "company_stage", "team_members"})
 
-        assert Profile is not None
+_PROFILE_FUNDING_FIELDS = frozenset({"funding_stage", "seeking_funding", "funding_amount_seeking"})
 
-    def test_profile_has_required_fields(self):
-        """Test Profile model has all required fields."""
-        from src.opportunity_radar.models.profile import Profile
+_PROFILE_PRODUCT_FIELDS = frozenset(
+    {"product_name", "product_description", "product_url", "product_stage"}
+)
 
-        fields = Profile.model_fields
+_PROFILE_TRACK_RECORD_FIELDS = frozenset(
+    {"previous_accelerators", "previous_hackathon_wins", "notable_achievements"}
+)
 
-        # Core fields
-        assert "user_id" in fields
-        assert "display_name" in fields
-        assert "bio" in fields
-        assert "tech_stack" in fields
-        assert "experience_level" in fields
+_EXPECTED_EXPERIENCE_LEVELS = frozenset({"beginner", "intermediate", "advanced", "expert"})
 
-        # Preferences
-        assert "availability_hours_per_week" in fields
-        assert "timezone" in fields
-        assert "preferred_team_size_min" in fields
-        assert "preferred_team_size_max" in fields
+_TEAM_MEMBER_FIELDS = frozenset({"name", "role", "linkedin_url", "skills"})
 
-        # Goals and interests
-        assert "goals" in fields
-        assert "interests" in fields
 
-        # Location
-        assert "location_country" in fields
-        assert "location_region" in fields
+@pytest.fixture(scope="module")
+def profile_fields():
+    """Profile field names, read once per module."""
+    return frozenset(Profile.model_fields)
 
-        # Student info
-        assert "student_status" in fields
-        assert "university" in fields
 
-        # Social links
-        assert "github_url" in fields
-        assert "linkedin_url" in fields
-        assert "portfolio_url" in fields
+@pytest.fixture(scope="module")
+def profile_defaults():
+    """Profile field defaults, read once per module."""
+    return {name: field.default for name, field in Profile.model_fields.items()}
 
-    def test_profile_has_team_fields(self):
-        """Test Profile has team-related fields."""
-        from src.opportunity_radar.models.profile import Profile
 
-        fields = Profile.model_fields
+@pytest.fixture(scope="module")
+def team_member_fields():
+    """TeamMember field names, read once per module."""
+    return frozenset(TeamMember.model_fields)
 
-        assert "team_name" in fields
-        assert "team_size" in fields
-        assert "company_stage" in fields
-        assert "team_members" in fields
 
-    def test_profile_has_funding_fields(self):
-        """Test Profile has funding-related fields."""
-        from src.opportunity_radar.models.profile import Profile
+@pytest.mark.xdist_group(name="profile")
+class TestProfileModel:
+    """Test Profile model functionality."""
 
-        fields = Profile.model_fields
+    def test_import_profile(self):
+        """Test Profile model import."""
+        assert Profile is not None
 
-        assert "funding_stage" in fields
-        assert "seeking_funding" in fields
-        assert "funding_amount_seeking" in fields
+    def test_profile_has_required_fields(self, profile_fields):
+        """Test Profile model has all required fields."""
+        assert _PROFILE_REQUIRED_FIELDS <= profile_fields
 
-    def test_profile_has_product_fields(self):
-        """Test Profile has product-related fields."""
-        from src.opportunity_radar.models.profile import Profile
+    def test_profile_has_team_fields(self, profile_fields):
+        """Test Profile has team-related fields."""
+        assert _PROFILE_TEAM_FIELDS <= profile_fields
 
-        fields = Profile.model_fields
+    def test_profile_has_funding_fields(self, profile_fields):
+        """Test Profile has funding-related fields."""
+        assert _PROFILE_FUNDING_FIELDS <= profile_fields
 
-        assert "product_name" in fields
-        assert "product_description" in fields
-        assert "product_url" in fields
-        assert "product_stage" in fields
+    def test_profile_has_product_fields(self, profile_fields):
+        """Test Profile has product-related fields."""
+        assert _PROFILE_PRODUCT_FIELDS <= profile_fields
 
-    def test_profile_has_track_record_fields(self):
+    def test_profile_has_track_record_fields(self, profile_fields):
         """Test Profile has track record fields."""
-        from src.opportunity_radar.models.profile import Profile
+        assert _PROFILE_TRACK_RECORD_FIELDS <= profile_fields
 
-        fields = Profile.model_fields
-
-        assert "previous_accelerators" in fields
-        assert "previous_hackathon_wins" in fields
-        assert "notable_achievements" in fields
-
-    def test_profile_has_embedding_field(self):
+    def test_profile_has_embedding_field(self, profile_fields):
         """Test Profile has embedding field."""
-        from src.opportunity_radar.models.profile import Profile
-
-        assert "embedding" in Profile.model_fields
+        assert "embedding" in profile_fields
 
-    def test_profile_default_values(self):
+    def test_profile_default_values(self, profile_defaults):
         """Test Profile default values."""
-        from src.opportunity_radar.models.profile import Profile
-
-        assert Profile.model_fields["preferred_team_size_min"].default == 1
-        assert Profile.model_fields["preferred_team_size_max"].default == 5
-        assert Profile.model_fields["seeking_funding"].default is False
-        assert Profile.model_fields["previous_hackathon_wins"].default == 0
+        expected = {
+            "preferred_team_size_min": 1,
+            "preferred_team_size_max": 5,
+            "seeking_funding": False,
+            "previous_hackathon_wins": 0,
+        }
+        assert {name: profile_defaults[name] for name in expected} == expected
 
 
+@pytest.mark.xdist_group(name="profile")
 class TestTeamMember:
     """Test TeamMember model."""
 
     def test_import_team_member(self):
         """Test TeamMember import."""
-        from src.opportunity_radar.models.profile import TeamMember
-
         assert TeamMember is not None
 
-    def test_team_member_fields(self):
+    def test_team_member_fields(self, team_member_fields):
         """Test TeamMember has required fields."""
-        from src.opportunity_radar.models.profile import TeamMember
-
-        fields = TeamMember.model_fields
-
-        assert "name" in fields
-        assert "role" in fields
-        assert "linkedin_url" in fields
-        assert "skills" in fields
+        assert _TEAM_MEMBER_FIELDS <= team_member_fields
 
 
+@pytest.mark.xdist_group(name="profile")
 class TestProfileStageTypes:
     """Test Profile stage literal types."""
 
-    def test_company_stage_values(self):
-        """Test valid company stage values."""
-        from src.opportunity_radar.models.profile import CompanyStage
-
-        valid_stages = ["idea", "prototype", "mvp", "launched", "revenue", "funded"]
-        assert len(valid_stages) == 6
-
-    def test_funding_stage_values(self):
-        """Test valid funding stage values."""
-        from src.opportunity_radar.models.profile import FundingStage
-
-        valid_stages = ["bootstrapped", "pre_seed", "seed", "series_a", "series_b_plus"]
-        assert len(valid_stages) == 5
-
-    def test_product_stage_values(self):
-        """Test valid product stage values."""
-        from src.opportunity_radar.models.profile import ProductStage
-
-        valid_stages = ["concept", "development", "beta", "live"]
-        assert len(valid_stages) == 4
-
-
+    @pytest.mark.parametrize(
+        "alias,expected",
+        [
+            (CompanyStage, {"idea", "prototype", "mvp", "launched", "revenue", "funded"}),
+            (FundingStage, {"bootstrapped", "pre_seed", "seed", "series_a", "series_b_plus"}),
+            (ProductStage, {"concept", "development", "beta", "live"}),
+        ],
+        ids=["company", "funding", "product"],
+    )
+    def test_stage_values(self, alias, expected):
+        """Test the stage literals accept exactly the expected values."""
+        assert set(get_args(alias)) == expected
+
+
+@pytest.mark.xdist_group(name="profile")
 class TestProfileService:
     """Test ProfileService functionality."""
 
     def test_import_profile_service(self):
         """Test ProfileService import."""
-        from src.opportunity_radar.services import ProfileService
-
         assert ProfileService is not None
 
 
+@pytest.mark.xdist_group(name="profile")
 class TestProfileSchema:
     """Test Profile schemas."""
 
     def test_import_profile_create_schema(self):
         """Test ProfileCreate schema import."""
-        from src.opportunity_radar.schemas.profile import ProfileCreate
-
         assert ProfileCreate is not None
 
     def test_import_profile_update_schema(self):
         """Test ProfileUpdate schema import."""
-        from src.opportunity_radar.schemas.profile import ProfileUpdate
-
         assert ProfileUpdate is not None
 
     def test_import_profile_response_schema(self):
         """Test ProfileResponse schema import."""
-        from src.opportunity_radar.schemas.profile import ProfileResponse
-
         assert ProfileResponse is not None
 
 
+@pytest.mark.xdist_group(name="profile")
 class TestProfileWorkflow:
     """Test Profile workflow logic."""
 
     def test_experience_levels(self):
-        """Test valid experience levels."""
-        experience_levels = ["beginner", "intermediate", "advanced", "expert"]
-
-        assert len(experience_levels) == 4
-
-    def test_student_statuses(self):
-        """Test valid student statuses."""
-        student_statuses = ["undergraduate", "graduate", "phd", "bootcamp", "self_taught", "not_student"]
-
-        assert len(student_statuses) == 6
-
-    def test_goal_types(self):
-        """Test common profile goals."""
-        common_goals = [
-            "win_prize",
-            "learn_skills",
-            "build_portfolio",
-            "network",
-            "get_funding",
-            "launch_product",
-        ]
-
-        assert len(common_goals) >= 4
+        """Test the experience levels offered for a profile."""
+        assert {level.value for level in ExperienceLevelOption} == _EXPECTED_EXPERIENCE_LEVELS
@@ -1,73 +1,57 @@
 """Unit tests for services."""
 
+from unittest.mock import patch
+
 import pytest
 
+from src.opportunity_radar import services
+from src.opportunity_radar.services.embedding_service import EMBEDDING_MODEL
+
 
+@pytest.mark.xdist_group(name="services")
 class TestServiceImports:
     """Test that all services can be imported correctly."""
 
-    def test_import_auth_service(self):
-        """Test AuthService import."""
-        from src.opportunity_radar.services import AuthService
-
-        assert AuthService is not None
-
-    def test_import_opportunity_service(self):
-        """Test OpportunityService import."""
-        from src.opportunity_radar.services import OpportunityService
-
-        assert OpportunityService is not None
-
-    def test_import_embedding_service(self):
-        """Test EmbeddingService import."""
-        from src.opportunity_radar.services import EmbeddingService
-
-        assert EmbeddingService is not None
-
-    def test_import_matching_service(self):
-        """Test MatchingService import."""
-        from src.opportunity_radar.services import MatchingService
-
-        assert MatchingService is not None
-
-    def test_import_profile_service(self):
-        """Test ProfileService import."""
-        from src.opportunity_radar.services import ProfileService
-
-        assert ProfileService is not None
-
-    def test_import_pipeline_service(self):
-        """Test PipelineService import."""
-        from src.opportunity_radar.services import PipelineService
-
-        assert PipelineService is not None
-
-
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "AuthService",
+            "OpportunityService",
+            "EmbeddingService",
+            "MatchingService",
+            "ProfileService",
+            "PipelineService",
+        ],
+    )
+    def test_import_service(self, name):
+        """Test each service is exported from the services package."""
+        assert getattr(services, name) is not None
+
+
+@pytest.mark.xdist_group(name="services")
 class TestEmbeddingService:
     """Test EmbeddingService functionality."""
 
     def test_get_embedding_service_singleton(self):
         """Test embedding service singleton pattern."""
-        from src.opportunity_radar.services import get_embedding_service
-
-        service1 = get_embedding_service()
-        service2 = get_embedding_service()
-        assert service1 is service2
+        services.get_embedding_service.cache_clear()
+        try:
+            # No real OpenAI client (or API key) is needed to build the singleton
+            with patch("openai.OpenAI"):
+                service = services.get_embedding_service()
+                assert services.get_embedding_service() is service
+        finally:
+            services.get_embedding_service.cache_clear()
 
     def test_embedding_service_model(self):
         """Test embedding service uses correct model constant."""
-        from src.opportunity_radar.services.embedding_service import EMBEDDING_MODEL
-
         # Just verify the constant is set correctly
         # The actual service initialization requires OpenAI API key
         assert EMBEDDING_MODEL == "text-embedding-3-small"
 
-    def test_create_opportunity_embedding_text(self):
+    def test_create_opportunity_embedding_text(self, embedding_service):
         """Test opportunity embedding text creation."""
-        from src.opportunity_radar.services import get_embedding_service
-
-        service = get_embedding_service()
-        text = service.create_opportunity_embedding_text(
+        text = embedding_service.create_opportunity_embedding_text(
             title="AI Hackathon 2024",
             description="Build innovative AI solutions",
             tags=["AI", "ML"],
@@ -79,12 +63,9 @@ class TestEmbeddingService:
         assert "hackathon" in text.lower()
         assert len(text) > 50
 
-    def test_create_profile_embedding_text(self):
+    def test_create_profile_embedding_text(self, embedding_service):
         """Test profile embedding text creation."""
-        from src.opportunity_radar.services import get_embedding_service
-
-        service = get_embedding_service()
-        text = service.create_profile_embedding_text(
+        text = embedding_service.create_profile_embedding_text(
             tech_stack=["Python", "JavaScript"],
             industries=["FinTech", "Healthcare"],
             intents=["funding", "learning"],
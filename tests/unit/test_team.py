@@ -1,187 +1,161 @@
 """Unit tests for Team collaboration workflow."""
 
+from types import MappingProxyType
+from typing import get_args
+
 import pytest
-from datetime import datetime
 from beanie import PydanticObjectId
 
-
-class TestTeamModel:
-    """Test Team model functionality."""
-
-    def test_import_team(self):
-        """Test Team model import."""
-        from src.opportunity_radar.models.team import Team
-
-        assert Team is not None
-
-    def test_team_has_required_fields(self):
-        """Test Team model has all required fields."""
-        from src.opportunity_radar.models.team import Team
-
-        fields = Team.model_fields
-
-        assert "name" in fields
-        assert "description" in fields
-        assert "owner_id" in fields
-        assert "members" in fields
-        assert "invites" in fields
-        assert "shared_opportunities" in fields
-        assert "is_public" in fields
-        assert "max_members" in fields
-
-    def test_team_default_values(self):
-        """Test Team default values."""
-        from src.opportunity_radar.models.team import Team
-
-        assert Team.model_fields["is_public"].default is False
-        assert Team.model_fields["max_members"].default == 10
-
-
-class TestTeamMemberInfo:
-    """Test TeamMemberInfo model."""
-
-    def test_import_team_member_info(self):
-        """Test TeamMemberInfo import."""
-        from src.opportunity_radar.models.team import TeamMemberInfo
-
-        assert TeamMemberInfo is not None
-
-    def test_team_member_info_fields(self):
-        """Test TeamMemberInfo has required fields."""
-        from src.opportunity_radar.models.team import TeamMemberInfo
-
-        fields = TeamMemberInfo.model_fields
-        assert "user_id" in fields
-        assert "role" in fields
-        assert "joined_at" in fields
-
-    def test_team_member_default_role(self):
-        """Test default role is 'member'."""
-        from src.opportunity_radar.models.team import TeamMemberInfo
-
-        assert TeamMemberInfo.model_fields["role"].default == "member"
-
-
-class TestTeamInvite:
-    """Test TeamInvite model."""
-
-    def test_import_team_invite(self):
-        """Test TeamInvite import."""
-        from src.opportunity_radar.models.team import TeamInvite
-
-        assert TeamInvite is not None
-
-    def test_team_invite_fields(self):
-        """Test TeamInvite has required fields."""
-        from src.opportunity_radar.models.team import TeamInvite
-
-        fields = TeamInvite.model_fields
-        assert "email" in fields
-        assert "invited_by" in fields
-        assert "status" in fields
-        assert "created_at" in fields
-        assert "expires_at" in fields
-
-    def test_team_invite_default_status(self):
-        """Test default invite status is 'pending'."""
-        from src.opportunity_radar.models.team import TeamInvite
-
-        assert TeamInvite.model_fields["status"].default == "pending"
-
-
+from src.opportunity_radar.models import team as team_models
+from src.opportunity_radar.models.team import (
+    InviteStatus,
+    Team,
+    TeamInvite,
+    TeamMemberInfo,
+    TeamRole,
+)
+
+# Expected invite status transitions
+_INVITE_WORKFLOW = MappingProxyType(
+    {
+        "pending": ["accepted", "declined", "expired"],
+        "accepted": [],  # Terminal
+        "declined": [],  # Terminal
+        "expired": ["pending"],  # Can re-invite
+    }
+)
+
+_EXPECTED_ROLES = frozenset({"owner", "admin", "member"})
+
+_EXPECTED_STATUSES = frozenset({"pending", "accepted", "declined", "expired"})
+
+# One user id per team role, plus one for a user outside the team
+_USER_IDS = MappingProxyType(
+    {name: PydanticObjectId() for name in ("owner", "admin", "member", "outsider")}
+)
+
+_TEAM_REQUIRED_FIELDS = frozenset(
+    {
+        "name",
+        "description",
+        "owner_id",
+        "members",
+        "invites",
+        "shared_opportunities",
+        "is_public",
+        "max_members",
+    }
+)
+
+_TEAM_MEMBER_INFO_FIELDS = frozenset({"user_id", "role", "joined_at"})
+
+_TEAM_INVITE_FIELDS = frozenset({"email", "invited_by", "status", "created_at", "expires_at"})
+
+
+@pytest.fixture(scope="module")
+def team_callables():
+    """Names of callable Team attributes, collected once per module."""
+    return frozenset(name for name in dir(Team) if callable(getattr(Team, name, None)))
+
+
+@pytest.fixture(scope="module")
+def team():
+    """Team with one member per role, built without a database."""
+    return Team.model_construct(
+        members=[TeamMemberInfo(user_id=_USER_IDS[role], role=role) for role in get_args(TeamRole)]
+    )
+
+
+@pytest.mark.xdist_group(name="team")
+class TestTeamModels:
+    """Test the Team, TeamMemberInfo and TeamInvite models."""
+
+    @pytest.mark.parametrize(
+        "name", ["Team", "TeamMemberInfo", "TeamInvite", "TeamRole", "InviteStatus"]
+    )
+    def test_import(self, name):
+        """Test the team module exports its models and literal types."""
+        assert getattr(team_models, name, None) is not None
+
+    @pytest.mark.parametrize(
+        "model,required",
+        [
+            (Team, _TEAM_REQUIRED_FIELDS),
+            (TeamMemberInfo, _TEAM_MEMBER_INFO_FIELDS),
+            (TeamInvite, _TEAM_INVITE_FIELDS),
+        ],
+        ids=["team", "member", "invite"],
+    )
+    def test_required_fields(self, model, required):
+        """Test each team model has its required fields."""
+        missing = required - model.model_fields.keys()
+        assert not missing, f"Missing fields: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        "model,field,expected",
+        [
+            (Team, "is_public", False),
+            (Team, "max_members", 10),
+            (TeamMemberInfo, "role", "member"),
+            (TeamInvite, "status", "pending"),
+        ],
+        ids=["team-is_public", "team-max_members", "member-role", "invite-status"],
+    )
+    def test_default_values(self, model, field, expected):
+        """Test team, member and invite default values."""
+        assert model.model_fields[field].default == expected
+
+
+@pytest.mark.xdist_group(name="team")
 class TestTeamRoles:
     """Test Team role types."""
 
     def test_valid_team_roles(self):
         """Test valid team roles."""
-        from src.opportunity_radar.models.team import TeamRole
-
-        # TeamRole is a Literal type with these values
-        valid_roles = ["owner", "admin", "member"]
-        assert len(valid_roles) == 3
+        assert frozenset(get_args(TeamRole)) == _EXPECTED_ROLES
 
     def test_valid_invite_statuses(self):
         """Test valid invite statuses."""
-        from src.opportunity_radar.models.team import InviteStatus
-
-        # InviteStatus is a Literal type with these values
-        valid_statuses = ["pending", "accepted", "declined", "expired"]
-        assert len(valid_statuses) == 4
+        assert frozenset(get_args(InviteStatus)) == _EXPECTED_STATUSES
 
 
+@pytest.mark.xdist_group(name="team")
 class TestTeamMethods:
     """Test Team model methods."""
 
-    def test_get_member_method_exists(self):
-        """Test get_member method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "get_member")
-        assert callable(getattr(Team, "get_member"))
-
-    def test_is_member_method_exists(self):
-        """Test is_member method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "is_member")
-        assert callable(getattr(Team, "is_member"))
-
-    def test_is_admin_method_exists(self):
-        """Test is_admin method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "is_admin")
-        assert callable(getattr(Team, "is_admin"))
-
-    def test_add_member_method_exists(self):
-        """Test add_member method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "add_member")
-        assert callable(getattr(Team, "add_member"))
-
-    def test_remove_member_method_exists(self):
-        """Test remove_member method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "remove_member")
-        assert callable(getattr(Team, "remove_member"))
-
-    def test_share_opportunity_method_exists(self):
-        """Test share_opportunity method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "share_opportunity")
-        assert callable(getattr(Team, "share_opportunity"))
-
-    def test_unshare_opportunity_method_exists(self):
-        """Test unshare_opportunity method exists."""
-        from src.opportunity_radar.models.team import Team
-
-        assert hasattr(Team, "unshare_opportunity")
-        assert callable(getattr(Team, "unshare_opportunity"))
-
-
+    @pytest.mark.parametrize(
+        "method_name",
+        [
+            "get_member",
+            "is_member",
+            "is_admin",
+            "add_member",
+            "remove_member",
+            "share_opportunity",
+            "unshare_opportunity",
+        ],
+    )
+    def test_team_method_exists(self, team_callables, method_name):
+        """Test Team exposes the membership and sharing methods."""
+        assert method_name in team_callables, f"Missing method: {method_name}"
+
+
+@pytest.mark.xdist_group(name="team")
 class TestTeamWorkflow:
     """Test Team workflow logic."""
 
-    def test_admin_roles(self):
-        """Test which roles are considered admin."""
-        admin_roles = ["owner", "admin"]
-        member_role = "member"
-
-        assert member_role not in admin_roles
-        assert "owner" in admin_roles
-        assert "admin" in admin_roles
+    @pytest.mark.parametrize(
+        "user,expected",
+        [("owner", True), ("admin", True), ("member", False), ("outsider", False)],
+    )
+    def test_admin_roles(self, team, user, expected):
+        """Test only owners and admins are considered admins."""
+        assert team.is_admin(_USER_IDS[user]) is expected
 
     def test_invite_workflow(self):
-        """Test invite workflow statuses."""
-        workflow = {
-            "pending": ["accepted", "declined", "expired"],
-            "accepted": [],  # Terminal
-            "declined": [],  # Terminal
-            "expired": ["pending"],  # Can re-invite
-        }
-
-        for status, transitions in workflow.items():
-            assert isinstance(transitions, list)
+        """Test every invite status has transitions to valid statuses."""
+        statuses = set(get_args(InviteStatus))
+
+        assert _INVITE_WORKFLOW.keys() == statuses
+        for transitions in _INVITE_WORKFLOW.values():
+            assert set(transitions) <= statuses